@@ -2,6 +2,7 @@ from PIL import Image, ImageDraw, ImageColor, ImageFont, ImageChops, ImageOps
 import logging
 import os
 import math
+import functools
 import shutil
 import platform
 from dataclasses import dataclass, field
@@ -67,35 +68,44 @@ def _load_font(name_or_path: str, size: int) -> ImageFont.FreeTypeFont:
         except IOError: return ImageFont.load_default()
 
 def _apply_rotation(img: Image.Image, rotation: int) -> Image.Image:
-    if rotation == 90: return img.rotate(-90, expand=True)
-    elif rotation == 180: return img.rotate(180)
-    elif rotation == 270: return img.rotate(-270, expand=True)
+    # Clockwise quarter turns; transpose only reorders pixels, no resampling.
+    if rotation == 90: return img.transpose(Image.Transpose.ROTATE_270)
+    elif rotation == 180: return img.transpose(Image.Transpose.ROTATE_180)
+    elif rotation == 270: return img.transpose(Image.Transpose.ROTATE_90)
     return img
 
+@functools.lru_cache(maxsize=32)
+def _rounded_mask(size: Tuple[int, int], radius: int) -> Image.Image:
+    """White rounded rectangle on black; shared by every cell of the same size."""
+    mask = Image.new('L', size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle([(0, 0), size], radius=radius, fill=255)
+    return mask
+
 def _apply_rounding(img: Image.Image, radius: int) -> Image.Image:
     """
     Applies rounded corners to an image by modifying its alpha channel.
     """
     if radius <= 0:
         return img
-    
-    # Ensure we are working with RGBA to have an alpha channel
-    img = img.convert("RGBA")
-    
-    # Create a mask (white = visible, black = transparent)
-    mask = Image.new('L', img.size, 0)
-    draw = ImageDraw.Draw(mask)
-    
-    # Draw the white rounded rectangle
-    draw.rounded_rectangle([(0, 0), img.size], radius=radius, fill=255)
-    
-    # Combine the new mask with the existing alpha channel (if any)
-    existing_alpha = img.split()[3]
-    final_alpha = ImageChops.multiply(existing_alpha, mask)
-    
-    img.putalpha(final_alpha)
+
+    mask = _rounded_mask(img.size, radius)
+    if img.mode == "RGBA":
+        # Combine the mask with the existing alpha channel
+        img.putalpha(ImageChops.multiply(img.getchannel("A"), mask))
+    else:
+        img = img.convert("RGBA")
+        img.putalpha(mask)
     return img
 
+def _prepare_cell(img: Image.Image) -> Image.Image:
+    """Opaque frames stay RGB (cheaper to resize and paste); anything with alpha becomes RGBA."""
+    if img.mode in ("RGB", "RGBA"): return img
+    has_alpha = "A" in img.getbands() or "transparency" in img.info
+    return img.convert("RGBA" if has_alpha else "RGB")
+
+def _paste_cell(canvas: Image.Image, img: Image.Image, pos: Tuple[int, int]):
+    canvas.paste(img, pos, mask=img if img.mode == "RGBA" else None)
+
 def _draw_frame_info(draw, text, img_w, img_h, conf, font):
     bbox = draw.textbbox((0, 0), text, font=font)
     text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
@@ -132,6 +142,13 @@ def _coerce_image_item(item: Union[str, Dict[str, Any]]) -> Tuple[str, Dict[str,
         return item.get("image_path", ""), item
     return item, {"image_path": item}
 
+def _open_source_image(path: str, meta: Dict[str, Any]) -> Image.Image:
+    """Opens a thumbnail, preferring an in-memory frame (meta['image']: PIL image or BGR array)."""
+    frame = meta.get("image")
+    if frame is None: return Image.open(path)
+    if isinstance(frame, Image.Image): return frame.copy()
+    return Image.fromarray(frame[..., ::-1])
+
 def _format_timecode(seconds: Any) -> Optional[str]:
     if seconds is None:
         return None
@@ -162,11 +179,11 @@ def _header_text(first_path: str, first_meta: Dict[str, Any], config: GridConfig
 # --- Layout Engines ---
 
 def _create_fixed_column_grid(image_paths: List[Union[str, Dict[str, Any]]], config: GridConfig, logger: logging.Logger):
-    """Standard grid layout. Supports both dynamic size and fixed output size."""
+    """Standard grid layout. Supports both dynamic size and fixed output size. Returns (image, layout)."""
     layout_data = []
     image_items = [_coerce_image_item(item) for item in image_paths]
     image_items = [(path, meta) for path, meta in image_items if path]
-    if not image_items: return False, []
+    if not image_items: return None, []
 
     num_images = len(image_items)
     header_height = 50 if config.font_settings.show_header else 0
@@ -196,7 +213,7 @@ def _create_fixed_column_grid(image_paths: List[Union[str, Dict[str, Any]]], con
         # Sample first few images to guess aspect ratio
         for p, _meta in image_items[:5]:
             try:
-                with Image.open(p) as img:
+                with _open_source_image(p, _meta) as img:
                     if config.rotation in [90, 270]: w, h = img.height, img.width
                     else: w, h = img.size
                     max_w = max(max_w, w)
@@ -217,7 +234,7 @@ def _create_fixed_column_grid(image_paths: List[Union[str, Dict[str, Any]]], con
     try:
         bg_rgb = ImageColor.getrgb(config.bg_color_hex)
         grid_image = Image.new("RGB", (grid_w, grid_h), bg_rgb)
-    except: return False, []
+    except: return None, []
 
     draw = ImageDraw.Draw(grid_image)
     if config.font_settings.show_header:
@@ -232,10 +249,9 @@ def _create_fixed_column_grid(image_paths: List[Union[str, Dict[str, Any]]], con
 
     for i, (path, meta) in enumerate(image_items):
         try:
-            with Image.open(path) as img:
+            with _open_source_image(path, meta) as img:
                 # 1. Rotate
-                img = _apply_rotation(img, config.rotation)
-                img = img.convert("RGBA")
+                img = _prepare_cell(_apply_rotation(img, config.rotation))
                 
                 # 2. Resize / Fit
                 if config.fit_to_output_params:
@@ -261,7 +277,7 @@ def _create_fixed_column_grid(image_paths: List[Union[str, Dict[str, Any]]], con
                     label = _frame_info_label(meta, i, config.font_settings)
                     _draw_frame_info(d_tmp, label, img.width, img.height, config.font_settings, info_font)
 
-                grid_image.paste(img, (paste_x, paste_y), mask=img)
+                _paste_cell(grid_image, img, (paste_x, paste_y))
                 layout_data.append({'image_path': path, 'x': paste_x, 'y': paste_y, 'width': img.width, 'height': img.height})
 
         except Exception as e: logger.error(f"Error thumb {path}: {e}")
@@ -272,15 +288,12 @@ def _create_fixed_column_grid(image_paths: List[Union[str, Dict[str, Any]]], con
         else:
             current_x += cell_w + config.padding
 
-    if _save_image_optimized(grid_image, config.output_path, config.quality, logger):
-        return True, layout_data
-    else:
-        return False, []
+    return grid_image, layout_data
 
 def _create_timeline_grid(source_data: List[Dict[str, Any]], config: GridConfig, logger: logging.Logger):
-    """Timeline layout (Variable width rows)."""
+    """Timeline layout (Variable width rows). Returns (image, layout)."""
     layout_data = []
-    if not source_data: return False, []
+    if not source_data: return None, []
 
     target_h = config.target_row_height
     max_w = max(1, config.output_width - (2 * config.grid_margin))
@@ -303,7 +316,7 @@ def _create_timeline_grid(source_data: List[Dict[str, Any]], config: GridConfig,
         if not path:
             continue
         try:
-            with Image.open(path) as img:
+            with _open_source_image(path, meta) as img:
                  native_w, native_h = img.size
                  aspect = native_w / native_h
                  try:
@@ -318,7 +331,7 @@ def _create_timeline_grid(source_data: List[Dict[str, Any]], config: GridConfig,
             continue
 
     if not items:
-        return False, []
+        return None, []
 
     for item in items:
         if current_row and current_row_width + item['w'] + config.padding > max_w:
@@ -335,7 +348,7 @@ def _create_timeline_grid(source_data: List[Dict[str, Any]], config: GridConfig,
     try:
         bg_rgb = ImageColor.getrgb(config.bg_color_hex)
         grid_image = Image.new("RGB", (config.output_width, total_grid_h), bg_rgb)
-    except: return False, []
+    except: return None, []
 
     draw = ImageDraw.Draw(grid_image)
     if config.font_settings.show_header and source_data:
@@ -360,9 +373,8 @@ def _create_timeline_grid(source_data: List[Dict[str, Any]], config: GridConfig,
                 draw_w = int(item['w'] * scale)
                 draw_h = target_h
 
-                with Image.open(item['path']) as img:
-                    img = _apply_rotation(img, config.rotation)
-                    img = img.convert("RGBA")
+                with _open_source_image(item['path'], item['meta']) as img:
+                    img = _prepare_cell(_apply_rotation(img, config.rotation))
                     img = img.resize((draw_w, target_h), Image.Resampling.BICUBIC)
 
                     if config.rounded_corners > 0:
@@ -375,7 +387,7 @@ def _create_timeline_grid(source_data: List[Dict[str, Any]], config: GridConfig,
                         d_tmp = ImageDraw.Draw(img)
                         _draw_frame_info(d_tmp, _frame_info_label(item['meta'], item['index'], config.font_settings), draw_w, target_h, config.font_settings, info_font)
 
-                    grid_image.paste(img, (x, y), mask=img)
+                    _paste_cell(grid_image, img, (x, y))
                     
                     layout_data.append({'image_path': item['path'], 'x': x, 'y': y, 'width': draw_w, 'height': target_h})
                     x += draw_w + int(config.padding * scale)
@@ -383,13 +395,10 @@ def _create_timeline_grid(source_data: List[Dict[str, Any]], config: GridConfig,
                 logger.warning(f"Failed to render timeline thumbnail '{item.get('path')}': {e}")
         y += target_h + config.padding
 
-    if _save_image_optimized(grid_image, config.output_path, config.quality, logger):
-        return True, layout_data
-    else:
-        return False, []
+    return grid_image, layout_data
 
-def create_image_grid(**kwargs):
-    """Adapter function."""
+def _grid_config(kwargs: Dict[str, Any]) -> GridConfig:
+    """Builds the layout configuration from create_image_grid keyword arguments."""
     font_conf = FontConfig(
         show_header=kwargs.get("show_header", True),
         show_file_path=kwargs.get("show_file_path", True),
@@ -425,6 +434,11 @@ def create_image_grid(**kwargs):
         font_settings=font_conf
     )
     
+    return grid_conf
+
+def compose_image_grid(**kwargs) -> Tuple[Optional[Image.Image], List[Dict[str, Any]]]:
+    """Lays out the grid in memory without saving it. Returns (image or None, layout)."""
+    grid_conf = _grid_config(kwargs)
     logger = kwargs.get("logger", logging.getLogger("image_grid"))
     image_source_data = kwargs.get("image_source_data", [])
 
@@ -433,4 +447,13 @@ def create_image_grid(**kwargs):
     elif grid_conf.layout_mode == "timeline":
         return _create_timeline_grid(image_source_data, grid_conf, logger)
     
+    return None, []
+
+def create_image_grid(**kwargs):
+    """Adapter function: composes the grid and writes it to output_path. Returns (success, layout)."""
+    grid_image, layout_data = compose_image_grid(**kwargs)
+    if grid_image is None: return False, []
+    logger = kwargs.get("logger", logging.getLogger("image_grid"))
+    if _save_image_optimized(grid_image, kwargs.get("output_path", ""), kwargs.get("quality", 95), logger):
+        return True, layout_data
     return False, []
@@ -1,7 +1,7 @@
 import customtkinter as ctk
 import tkinter as tk
 import logging
-from logging.handlers import RotatingFileHandler
+import logging.handlers
 from tkinter import ttk, filedialog, messagebox, colorchooser
 import os
 import sys
@@ -10,11 +10,15 @@ import tempfile
 import argparse
 import threading
 import queue
+import collections
 import time
 import json
 import traceback
+import weakref
+import contextlib
 import numpy as np
-from typing import Optional, List, Dict, Any, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple, Union, Callable
 from PIL import ImageTk, Image, ImageDraw, ImageChops, ImageOps
 
 # --- DEPENDENCY MANAGEMENT ---
@@ -76,6 +80,20 @@ except ImportError:
 
 # --- CONSTANTS ---
 SETTINGS_FILE = "movieprint_gui_settings.json"
+QUEUE_POLL_MS = 16         # While work is in flight
+QUEUE_IDLE_POLL_MS = 100   # When nothing is running or arriving
+QUEUE_BATCH_LIMIT = 64
+REFRESH_DEBOUNCE_MS = 200
+ZOOM_APPLY_MS = 16         # Slider/wheel zoom steps within this window render once
+ZOOM_CACHE_SIZE = 6        # Rendered zoom levels kept per preview image...
+ZOOM_CACHE_PIXELS = 16_000_000  # ...within this many zoomed pixels in total
+THUMB_CACHE_SIZE = 200     # Decoded preview frames kept for grid rebuilds
+GRID_CACHE_SIZE = 6        # Composed preview grids kept for undo/redo...
+GRID_CACHE_PIXELS = 16_000_000  # ...within this many grid pixels in total
+CORNER_MASK_CACHE_SIZE = 32  # Rounded-corner masks kept for live scrub updates
+SCRUB_CELL_CACHE_SIZE = 64   # Finished scrub cells kept while dragging back and forth
+BATCH_WORKERS = max(1, (os.cpu_count() or 1) // 4)  # Batch Queue videos at once; each runs up to 4 FFmpeg extractors
+LOG_BUFFER_RECORDS = 200   # Log file records written per batch (warnings flush at once)
 ctk.set_appearance_mode("Dark")
 
 class Theme:
@@ -140,6 +158,11 @@ class Theme:
     FONT_HEADER = ("Impact", 60)
     FONT_SUB = ("Roboto", 16)
     FONT_BOLD = ("Roboto", 12, "bold")
+    FONT_BODY = ("Roboto", 12)
+    FONT_SMALL = ("Roboto", 10)
+    FONT_STEP = ("Roboto", 40, "bold")
+    FONT_MATH = ("Roboto", 32, "bold")
+    FONT_MATH_OP = ("Roboto", 24)
 
     @classmethod
     def apply_preset(cls, name: str):
@@ -155,23 +178,36 @@ class Theme:
 Theme.apply_preset("Teal")
 
 # --- LOGGING SETUP ---
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 def setup_file_logging():
+    """Route root logging through a queue so file/console I/O runs on a listener thread."""
+    global _log_listener
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
     
+    sinks = []
     log_dir = os.path.expanduser(os.path.join("~", ".pymovieprint", "logs"))
     try:
         os.makedirs(log_dir, exist_ok=True)
         log_file = os.path.join(log_dir, "pymovieprint.log")
-        handler = RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=3, encoding='utf-8')
+        handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=3, encoding='utf-8', delay=True)
         handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-        root_logger.addHandler(handler)
+        # Buffer INFO chatter from the frame loops into one write per batch.
+        sinks.append(logging.handlers.MemoryHandler(
+            LOG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=handler, flushOnClose=True
+        ))
     except Exception as e:
         print(f"Failed to create user profile log: {e}")
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    root_logger.addHandler(console_handler)
+    sinks.append(console_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, *sinks, respect_handler_level=True)
+    _log_listener.start()
 
     for module_name, error_detail, error_traceback in DependencyManager.LOAD_FAILURES:
         root_logger.error(
@@ -188,7 +224,16 @@ def setup_file_logging():
         logging.critical("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
     sys.excepthook = handle_exception
 
-class QueueHandler(logging.Handler):
+def stop_file_logging():
+    """Flush queued log records and stop the listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for sink in _log_listener.handlers: sink.flush()
+        _log_listener = None
+
+class StatusQueueHandler(logging.Handler):
+    """Forwards formatted records to the app queue for the status bar."""
     def __init__(self, queue_instance: queue.Queue):
         super().__init__()
         self.queue = queue_instance
@@ -197,8 +242,67 @@ class QueueHandler(logging.Handler):
         log_entry = self.format(record)
         self.queue.put(("log", log_entry))
 
+# --- COMPONENT: Settings Persistence ---
+class SettingsWriter:
+    """Writes settings snapshots on a background thread; only the newest pending one is kept."""
+    __slots__ = ("path", "_slot", "_wake", "_closing", "_last_submitted", "_thread")
+
+    def __init__(self, path: str):
+        self.path = path
+        self._slot: collections.deque = collections.deque(maxlen=1)
+        self._wake = threading.Event()
+        self._closing = False
+        self._last_submitted: Optional[Dict[str, Any]] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, settings: Dict[str, Any]):
+        if settings == self._last_submitted: return
+        self._last_submitted = settings
+        self._slot.append(settings)
+        self._wake.set()
+
+    def close(self, timeout: float = 2.0):
+        """Write any pending snapshot and stop the writer thread."""
+        self._closing = True
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            try: settings = self._slot.popleft()
+            except IndexError: settings = None
+            if settings is not None:
+                self.write_atomic(self.path, settings)
+            if self._closing and not self._slot: break
+
+    @staticmethod
+    def write_atomic(path: str, settings: Dict[str, Any]):
+        directory = os.path.dirname(os.path.abspath(path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=".movieprint_settings_", suffix=".tmp", dir=directory)
+        except OSError as e:
+            logging.warning(f"Could not save settings: {e}")
+            return
+        try:
+            data = json.dumps(settings, indent=4)  # One write; json.dump writes per token
+            with os.fdopen(fd, 'w') as f: f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging.warning(f"Could not save settings: {e}")
+            try: os.remove(tmp_path)
+            except OSError: pass
+
 # --- COMPONENT: High-Performance Scrubbing ---
 class ScrubbingHandler:
+    __slots__ = (
+        "app", "active", "thumbnail_index", "start_x", "original_timestamp",
+        "video_path", "_scrub_slot", "_new_target", "_stop_event", "_worker_thread",
+        "_frame_buf", "_target_size",
+    )
+
     def __init__(self, app: 'MoviePrintApp'):
         self.app = app
         self.active: bool = False
@@ -206,11 +310,18 @@ class ScrubbingHandler:
         self.start_x: int = 0
         self.original_timestamp: float = 0.0
         self.video_path: Optional[str] = None
-        self._scrub_queue: queue.LifoQueue = queue.LifoQueue(maxsize=10)
+        # Single-slot mailbox: the newest scrub target replaces any unread one.
+        self._scrub_slot: collections.deque = collections.deque(maxlen=1)
+        self._new_target = threading.Event()
         self._stop_event = threading.Event()
         self._worker_thread: Optional[threading.Thread] = None
+        # BGR decode buffer reused across scrub ticks for the same video.
+        self._frame_buf: Optional[np.ndarray] = None
+        # Cell size in frame orientation; decoded frames are shrunk to just cover it.
+        self._target_size: Optional[Tuple[int, int]] = None
 
-    def start(self, event, thumbnail_index: int, original_timestamp: float, video_path: str):
+    def start(self, event, thumbnail_index: int, original_timestamp: float, video_path: str,
+              target_size: Optional[Tuple[int, int]] = None):
         if not video_path or not os.path.exists(video_path): return
         
         self.active = True
@@ -221,10 +332,10 @@ class ScrubbingHandler:
         
         self.app.preview_zoomable_canvas.canvas.config(cursor="sb_h_double_arrow")
         self._stop_event.clear()
-        
-        while not self._scrub_queue.empty():
-            try: self._scrub_queue.get_nowait()
-            except queue.Empty: break
+        self._new_target.clear()
+        self._scrub_slot.clear()
+        self._frame_buf = None
+        self._target_size = target_size
             
         self._worker_thread = threading.Thread(target=self._scrub_worker, daemon=True)
         self._worker_thread.start()
@@ -235,7 +346,7 @@ class ScrubbingHandler:
             self.thumbnail_index = -1
             self.app.preview_zoomable_canvas.canvas.config(cursor="")
             self._stop_event.set()
-            self._scrub_queue.put(None) 
+            self._new_target.set()
             self.app.queue.put(("log", "Scrubbing finished."))
 
     def handle_motion(self, event):
@@ -244,9 +355,8 @@ class ScrubbingHandler:
         pixels_per_second = 50.0 
         time_offset = dx / pixels_per_second
         new_timestamp = max(0.0, self.original_timestamp + time_offset)
-        try:
-            self._scrub_queue.put((new_timestamp, self.thumbnail_index), block=False)
-        except queue.Full: pass 
+        self._scrub_slot.append((new_timestamp, self.thumbnail_index))
+        self._new_target.set()
 
     def _scrub_worker(self):
         if not DependencyManager.video_processing: return
@@ -255,38 +365,41 @@ class ScrubbingHandler:
         try:
             with VideoExtractor(self.video_path) as extractor:
                 while not self._stop_event.is_set():
-                    try:
-                        item = self._scrub_queue.get(timeout=0.5)
-                        if item is None: break 
-                        
-                        target_ts, thumb_idx = item
-                        while not self._scrub_queue.empty():
-                            try:
-                                next_item = self._scrub_queue.get_nowait()
-                                if next_item is None:
-                                    self._stop_event.set()
-                                    break
-                                target_ts, thumb_idx = next_item
-                            except queue.Empty: break
-                        
-                        if self._stop_event.is_set(): break
-                        
-                        frame = extractor.extract_single_frame(target_ts)
-                        if frame is not None:
-                            cv2 = DependencyManager.video_processing.cv2
-                            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                            pil_img = Image.fromarray(frame_rgb)
-                            
-                            self.app.queue.put(("update_thumbnail", {
-                                "index": thumb_idx, 
-                                "image": pil_img, 
-                                "timestamp": target_ts
-                            }))
-                            
-                    except queue.Empty: continue 
+                    if not self._new_target.wait(timeout=0.5): continue
+                    self._new_target.clear()
+                    try: target_ts, thumb_idx = self._scrub_slot.popleft()
+                    except IndexError: continue
+
+                    if self._stop_event.is_set(): break
+
+                    frame = extractor.extract_single_frame(target_ts, out=self._frame_buf)
+                    if frame is not None:
+                        self._frame_buf = frame
+                        cv2 = DependencyManager.video_processing.cv2
+                        frame_rgb = cv2.cvtColor(self._shrink_to_cell(frame, cv2), cv2.COLOR_BGR2RGB)
+                        # Zero-copy wrap: frame_rgb is freshly allocated per tick and the
+                        # image keeps it alive, so the UI thread can read it safely.
+                        height, width = frame_rgb.shape[:2]
+                        pil_img = Image.frombuffer("RGB", (width, height), frame_rgb, "raw", "RGB", 0, 1)
+
+                        self.app.queue.put(("update_thumbnail", {
+                            "index": thumb_idx, 
+                            "image": pil_img, 
+                            "timestamp": target_ts,
+                            "frame_index": extractor.decoded_frame_index()
+                        }))
         except Exception as e:
             logging.error(f"Scrub worker error: {e}")
 
+    def _shrink_to_cell(self, frame, cv2):
+        """Nearest-downscale so the UI thread rotates and fits a cell-sized image, not a full frame."""
+        if not self._target_size: return frame
+        height, width = frame.shape[:2]
+        scale = max(self._target_size[0] / width, self._target_size[1] / height)
+        if scale >= 1.0: return frame
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        return cv2.resize(frame, size, interpolation=cv2.INTER_NEAREST)
+
 # --- UI COMPONENTS ---
 class ZoomableCanvas(ctk.CTkFrame):
     def __init__(self, master, app_ref: 'MoviePrintApp', **kwargs):
@@ -308,7 +421,13 @@ class ZoomableCanvas(ctk.CTkFrame):
         self.image_id: Optional[int] = None
         self.original_image: Optional[Image.Image] = None
         self.photo_image: Optional[ImageTk.PhotoImage] = None
-        self._zoom_level: float = 1.0
+        self._zoomed_image: Optional[Image.Image] = None  # Pixels currently in photo_image, when they were resized here
+        self._nearest_maps: Optional[tuple] = None  # ((w, h, W, H), src col per dest col, src row per dest row)
+        self._photo_cache: collections.OrderedDict = collections.OrderedDict()  # zoom -> (zoomed image, PhotoImage)
+        self._pyramid: List[Image.Image] = []  # original_image, then successive reduce(2) halves, built on demand
+        self._zoom_level: float = 1.0  # Level the displayed photo was rendered at
+        self._pending_zoom: Optional[float] = None
+        self._zoom_after_id: Optional[str] = None
         
         self.canvas.bind("<ButtonPress-1>", self.on_button_press)
         self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
@@ -344,10 +463,12 @@ class ZoomableCanvas(ctk.CTkFrame):
     def on_mouse_wheel(self, event):
         if self.app_ref.is_scrubbing_active(): return
         zoom_step = 1.1
+        # Wheel ticks that arrive before the next render keep compounding.
+        current = self._pending_zoom if self._pending_zoom is not None else self._zoom_level
         if (event.num == 5 or event.delta < 0):
-            new_zoom = self._zoom_level / zoom_step
+            new_zoom = current / zoom_step
         elif (event.num == 4 or event.delta > 0):
-            new_zoom = self._zoom_level * zoom_step
+            new_zoom = current * zoom_step
         else:
             return
 
@@ -363,50 +484,171 @@ class ZoomableCanvas(ctk.CTkFrame):
         return canvas_x / zoom, canvas_y / zoom
 
     def set_zoom(self, scale_level: float):
-        scale_level = float(scale_level)
+        """Request a zoom level; a burst of requests renders only the last one."""
+        self._pending_zoom = float(scale_level)
+        if self._zoom_after_id is None:
+            self._zoom_after_id = self.after(ZOOM_APPLY_MS, self._flush_zoom)
+
+    def destroy(self):
+        if self._zoom_after_id is not None: self.after_cancel(self._zoom_after_id)
+        self._zoom_after_id = None
+        super().destroy()
+
+    def _flush_zoom(self):
+        self._zoom_after_id = None
+        scale_level, self._pending_zoom = self._pending_zoom, None
+        if scale_level is None: return
+        scale_level = round(scale_level, 2)  # Coarse enough for slider drags to revisit cached levels
         if self._zoom_level == scale_level: return
         self._zoom_level = scale_level
         self._apply_zoom()
 
     def _apply_zoom(self):
         if not self.original_image or not self.image_id: return
+        cached = self._photo_cache.get(self._zoom_level)
+        if cached is not None:
+            self._photo_cache.move_to_end(self._zoom_level)
+            self._zoomed_image, self.photo_image = cached
+            self.canvas.itemconfig(self.image_id, image=self.photo_image)
+            self._set_scrollregion(self._zoomed_image.size)
+            return
         
         new_width = int(self.original_image.width * self._zoom_level)
         new_height = int(self.original_image.height * self._zoom_level)
         new_width = max(1, new_width)
         new_height = max(1, new_height)
         
-        resample_filter = Image.Resampling.BILINEAR if self._zoom_level < 1.0 else Image.Resampling.NEAREST
-        zoomed_image = self.original_image.resize((new_width, new_height), resample_filter)
+        if (new_width, new_height) == self.original_image.size:
+            zoomed_image = self.original_image  # 100%: nothing to resample, Tk copies the pixels anyway
+        else:
+            resample_filter = Image.Resampling.BILINEAR if self._zoom_level < 1.0 else Image.Resampling.NEAREST
+            zoomed_image = self._resample_source(new_width).resize((new_width, new_height), resample_filter)
         
         display_image = zoomed_image if zoomed_image.mode in ("RGB", "RGBA", "L") else zoomed_image.convert("RGBA")
+        self._zoomed_image = display_image
         self.photo_image = ImageTk.PhotoImage(display_image)
+        self._remember_zoom(self._zoom_level)
         self.canvas.itemconfig(self.image_id, image=self.photo_image)
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
-    def set_image(self, image_path: str):
-        if not image_path or not os.path.exists(image_path):
-            self.clear()
+        self._set_scrollregion(display_image.size)
+
+    def _set_scrollregion(self, size: Tuple[int, int]):
+        # The photo sits at (0, 0), so its size is the content extent; no bbox() walk needed.
+        self.canvas.configure(scrollregion=(0, 0, size[0], size[1]))
+
+    def _resample_source(self, width: int) -> Image.Image:
+        """Smallest pyramid level at least twice the target width: box-reduced halves
+        stand in for a full-size bilinear pass, and each new zoom-out reuses them."""
+        original = self.original_image
+        if self._zoom_level >= 0.5 or original.mode not in ("RGB", "RGBA", "L"): return original
+        levels = self._pyramid
+        if not levels: levels.append(original)
+        while levels[-1].width >= 4 * width and min(levels[-1].size) >= 2:
+            levels.append(levels[-1].reduce(2))
+        return next((level for level in reversed(levels) if level.width >= 2 * width), original)
+
+    def _patch_pyramid(self, bbox: Tuple[int, int, int, int]):
+        """original_image changed inside bbox: re-reduce just the 2x2 blocks it touches on
+        each level, so scrub patches and full renders keep sampling the same pixels."""
+        x0, y0, x1, y1 = bbox
+        levels = self._pyramid
+        for k in range(1, len(levels)):
+            parent = levels[k - 1]
+            x0, y0 = x0 // 2 * 2, y0 // 2 * 2
+            x1, y1 = min(parent.width, x1 + x1 % 2), min(parent.height, y1 + y1 % 2)
+            if x0 >= x1 or y0 >= y1: return
+            block = parent.reduce(2, box=(x0, y0, x1, y1))
+            x0, y0 = x0 // 2, y0 // 2
+            x1, y1 = x0 + block.width, y0 + block.height
+            levels[k].paste(block, (x0, y0))
+
+    def _remember_zoom(self, level: float):
+        cache = self._photo_cache
+        cache[level] = (self._zoomed_image, self.photo_image)
+        cache.move_to_end(level)
+        pixels = sum(img.width * img.height for img, _ in cache.values())
+        while len(cache) > 1 and (len(cache) > ZOOM_CACHE_SIZE or pixels > ZOOM_CACHE_PIXELS):
+            img, _ = cache.popitem(last=False)[1]
+            pixels -= img.width * img.height
+
+    def _forget_other_zooms(self):
+        """original_image changed: only the level being patched in place stays valid."""
+        current = self._photo_cache.get(self._zoom_level)
+        self._photo_cache.clear()
+        if current is not None: self._photo_cache[self._zoom_level] = current
+
+    def apply_zoom_region(self, bbox: Tuple[int, int, int, int]):
+        """Refresh the zoomed view after original_image changed only inside bbox
+        (original coords): resample just that patch and push it into the existing
+        PhotoImage instead of resizing the whole grid again."""
+        self._forget_other_zooms()
+        self._patch_pyramid(bbox)
+        zoomed = self._zoomed_image
+        original = self.original_image
+        if not original or not self.image_id: return
+        if zoomed is None or self.photo_image is None or zoomed.mode != original.mode:
+            self._apply_zoom()
             return
-        try:
-            self.original_image = Image.open(image_path)
-            self.app_ref.zoom_level_var.set(1.0)
-            self._zoom_level = 1.0
-            display_image = self.original_image if self.original_image.mode in ("RGB", "RGBA", "L") else self.original_image.convert("RGBA")
-            self.photo_image = ImageTk.PhotoImage(display_image)
-            
-            if self.image_id: self.canvas.delete(self.image_id)
-            self.image_id = self.canvas.create_image(0, 0, anchor="nw", image=self.photo_image)
-            self.canvas.configure(scrollregion=self.canvas.bbox(self.image_id))
-        except Exception as e:
-            logging.error(f"Error setting image: {e}")
+        (w, h), (W, H) = original.size, zoomed.size
+        x0, y0, x1, y1 = bbox
+        if self._zoom_level < 1.0:
+            # Bilinear reaches into neighbouring source pixels, so pad the patch a little.
+            sx, sy = W / w, H / h
+            dx0, dy0 = max(0, int(x0 * sx) - 2), max(0, int(y0 * sy) - 2)
+            dx1, dy1 = min(W, int(x1 * sx) + 3), min(H, int(y1 * sy) + 3)
+            if dx0 >= dx1 or dy0 >= dy1: return
+            # Sample the pyramid level the full render used, in that level's coordinates.
+            source = self._resample_source(W)
+            lx, ly = source.width / W, source.height / H
+            patch = source.resize((dx1 - dx0, dy1 - dy0), Image.Resampling.BILINEAR,
+                                  box=(dx0 * lx, dy0 * ly, dx1 * lx, dy1 * ly))
+        else:
+            # Nearest: reuse PIL's own column/row picks so the patch matches a full resize exactly.
+            xs, ys = self._nearest_index_maps(w, h, W, H)
+            dx0, dx1 = np.searchsorted(xs, [x0, x1])
+            dy0, dy1 = np.searchsorted(ys, [y0, y1])
+            if dx0 >= dx1 or dy0 >= dy1: return
+            sx0, sy0 = int(xs[dx0]), int(ys[dy0])
+            src = np.asarray(original.crop((sx0, sy0, int(xs[dx1 - 1]) + 1, int(ys[dy1 - 1]) + 1)))
+            patch = Image.fromarray(src[(ys[dy0:dy1] - sy0)[:, None], xs[dx0:dx1] - sx0], original.mode)
+        zoomed.paste(patch, (int(dx0), int(dy0)))
+        self.photo_image.paste(zoomed)
+
+    def _nearest_index_maps(self, w: int, h: int, W: int, H: int) -> Tuple[np.ndarray, np.ndarray]:
+        key = (w, h, W, H)
+        if self._nearest_maps is None or self._nearest_maps[0] != key:
+            def pick(n, m):
+                ramp = Image.fromarray(np.arange(n, dtype=np.int32)[None, :])
+                return np.asarray(ramp.resize((m, 1), Image.Resampling.NEAREST))[0].astype(np.intp)
+            self._nearest_maps = (key, pick(w, W), pick(h, H))
+        return self._nearest_maps[1], self._nearest_maps[2]
+
+    def set_image(self, image: Optional[Image.Image]):
+        """Show an already decoded image at 100%; None clears the canvas."""
+        if image is None:
             self.clear()
+            return
+        self.original_image = image
+        self.app_ref.zoom_level_var.set(1.0)
+        self._zoom_level = 1.0
+        self._pending_zoom = None  # A new image always opens at 100%
+        self.photo_image = ImageTk.PhotoImage(image)
+        self._zoomed_image = image
+        self._photo_cache.clear()
+        self._pyramid.clear()
+        self._remember_zoom(1.0)
+        
+        if self.image_id: self.canvas.delete(self.image_id)
+        self.image_id = self.canvas.create_image(0, 0, anchor="nw", image=self.photo_image)
+        self._set_scrollregion(image.size)
 
     def clear(self):
         if self.image_id: self.canvas.delete(self.image_id)
         self.image_id = None
         self.original_image = None
         self.photo_image = None
+        self._zoomed_image = None
+        self._photo_cache.clear()
+        self._pyramid.clear()
         self.canvas.configure(scrollregion=(0,0,0,0))
 
 class CTkCollapsibleFrame(ctk.CTkFrame):
@@ -441,6 +683,57 @@ class CTkCollapsibleFrame(ctk.CTkFrame):
 
 # --- MAIN APPLICATION ---
 class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
+    # (tk var name, settings field, Tk variable class) for every dynamic setting.
+    _SETTINGS_SCHEMA: Optional[Tuple[Tuple[str, str, type], ...]] = None
+    # (Namespace field, tk var name, converter or None) copied straight into the Generate settings.
+    _GENERATION_FIELDS: Tuple[Tuple[str, str, Optional[Callable]], ...] = (
+        ("layout_mode", "layout_mode_var", None),
+        ("extraction_mode", "extraction_mode_var", None),
+        ("shot_threshold", "shot_threshold_var", float),
+        ("frame_info_show", "frame_info_show_var", None),
+        ("detect_faces", "detect_faces_var", None),
+        ("rotate_thumbnails", "rotate_thumbnails_var", int),
+        ("output_quality", "output_quality_var", int),
+        ("hdr_tonemap", "hdr_tonemap_var", None),
+        ("hdr_algorithm", "hdr_algorithm_var", None),
+        ("fit_to_output_params", "fit_to_output_params_var", None),
+        ("output_width", "output_width_var", int),
+        ("output_height", "output_height_var", int),
+        ("recursive_scan", "recursive_scan_var", None),
+        ("overwrite_mode", "overwrite_mode_var", None),
+        ("padding", "padding_var", int),
+        ("background_color", "background_color_var", None),
+        ("frame_format", "frame_format_var", None),
+        ("output_naming_mode", "output_naming_mode_var", None),
+        ("output_filename_suffix", "output_filename_suffix_var", None),
+        ("output_filename", "output_filename_var", None),
+        ("output_frames_only", "output_frames_only_var", None),
+        ("individual_frames_output_dir", "individual_frames_output_dir_var", str.strip),
+        ("grid_margin", "grid_margin_var", int),
+        ("show_header", "show_header_var", None),
+        ("show_file_path", "show_file_path_var", None),
+        ("show_timecode", "show_timecode_var", None),
+        ("show_frame_num", "show_frame_num_var", None),
+        ("rounded_corners", "rounded_corners_var", int),
+        ("use_gpu", "use_gpu_var", None),
+        ("output_image_width", "output_width_var", int),
+        ("frame_info_timecode_or_frame", "frame_info_timecode_or_frame_var", None),
+        ("frame_info_font_color", "frame_info_font_color_var", None),
+        ("frame_info_bg_color", "frame_info_bg_color_var", None),
+        ("frame_info_position", "frame_info_position_var", None),
+        ("frame_info_size", "frame_info_size_var", int),
+        ("frame_info_margin", "frame_info_margin_var", int),
+    )
+    # (segmented button attr, tk var name) re-synced after settings are restored in bulk.
+    _SEGMENTED_WIDGETS: Tuple[Tuple[str, str], ...] = (
+        ("layout_mode_seg", "layout_mode_var"),
+        ("extraction_mode_seg", "extraction_mode_var"),
+        ("ui_theme_seg", "ui_theme_var"),
+        ("rotate_seg", "rotate_thumbnails_var"),
+        ("format_seg", "frame_format_var"),
+        ("overwrite_seg", "overwrite_mode_var"),
+    )
+
     def __init__(self):
         super().__init__()
         
@@ -452,22 +745,47 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
 
         self.title(f"PyMoviePrint Generator v{DependencyManager.version}")
         self.geometry("1500x950")
-        Theme.apply_preset(self._read_persistent_ui_theme())
+        persisted = self._read_settings_file()  # Parsed once; the theme is needed before the widgets exist
+        Theme.apply_preset(persisted.get("ui_theme", "Teal"))
         self.configure(fg_color=Theme.BG_PRIMARY)
         
         self._init_dnd()
         self.scrubbing_handler = ScrubbingHandler(self)
         self.temp_dirs_to_cleanup: List[str] = []
         self._internal_input_paths: List[str] = []
+        self._input_paths_text = ""  # Entry text _internal_input_paths was parsed from
         self.batch_file_list: List[str] = [] 
+        self._batch_keys: set = set()  # normcase'd batch_file_list entries, for O(1) duplicate checks
         self.queue = queue.Queue()
         self.preview_temp_dir: Optional[str] = None
+        self._preview_dirs: Dict[str, str] = {}  # source video -> scratch dir reused across previews
         self.is_landing_state = True
         self.is_busy = False
         self.active_cancel_event = None
         self.active_job_kind = None
         self._applying_theme = False
         self._loading_persistent_settings = False
+        self._dirty_settings: set = set()
+        self._settings_flush_id = None
+        self._settings_modify_depth = 0
+        self._refresh_after_id = None
+        self._refresh_gen = 0
+        self._refresh_running = False
+        self._refresh_pending = False
+        self._last_grid_key: Optional[tuple] = None
+        self._grid_cache: collections.OrderedDict = collections.OrderedDict()  # grid key -> (image, layout)
+        self._layout_boxes: Tuple[Optional[list], Optional[np.ndarray]] = (None, None)  # (layout, [x0, y0, x1, y1] rows)
+        self._duration_cache: Dict[tuple, float] = {}
+        self._last_math: Tuple[Optional[int], Optional[int]] = (None, None)  # (cols, rows) shown in the live math labels
+        self._vis_state: Optional[Tuple[str, str]] = None  # (layout, extraction) the option frames are packed for
+        self._face_cascades: collections.deque = collections.deque()  # Idle, already parsed classifiers
+        self._rc_mask_cache: collections.OrderedDict = collections.OrderedDict()  # (w, h, radius) -> 'L' mask
+        self._last_thumb_sig: Dict[int, tuple] = {}  # index -> what the live scrub last painted into that cell
+        self._scrub_cells: collections.OrderedDict = collections.OrderedDict()  # (frame, rot, fit, w, h, radius) -> cell
+        self._thumb_cache: collections.OrderedDict = collections.OrderedDict()  # (path, mtime) -> RGB image
+        self._thumb_cache_lock = threading.Lock()
+        self._bound_settings: Dict[str, Tuple[Callable[[], Any], str]] = {}  # var name -> (bound var.get, key)
+        self._settings_writer = SettingsWriter(SETTINGS_FILE)
         
         self.state_manager = DependencyManager.state_manager_cls()
         self._init_variables_dynamic()
@@ -476,12 +794,15 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
+        # CTk keeps the root unmapped until mainloop(), so everything built and
+        # loaded below is laid out in a single pass on first show. Avoid update()
+        # or update_idletasks() here: either would map and paint a half-built UI.
         self._build_sidebar()
         self._build_main_area()
         self._build_toolbar()
         self._build_action_footer()
 
-        self._load_persistent_settings()
+        self._load_persistent_settings(persisted)
         self._start_queue_poller()
         
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -490,14 +811,12 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self._update_live_math()
 
     @staticmethod
-    def _read_persistent_ui_theme():
+    def _read_settings_file() -> Dict[str, Any]:
+        """Saved settings as a dict; empty when the file is missing or unreadable."""
         try:
-            if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, 'r') as f:
-                    return json.load(f).get("ui_theme", "Teal")
-        except Exception:
-            pass
-        return "Teal"
+            with open(SETTINGS_FILE, 'rb') as f: settings = json.loads(f.read())
+        except (OSError, ValueError): return {}
+        return settings if isinstance(settings, dict) else {}
 
     def _init_dnd(self):
         self.dnd_active = False
@@ -507,6 +826,21 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                 self.dnd_active = True
             except Exception: pass
     
+    @classmethod
+    def _settings_schema(cls, default_settings) -> Tuple[Tuple[str, str, type], ...]:
+        """Build the settings-to-variable schema once and reuse it for every window."""
+        if cls._SETTINGS_SCHEMA is None:
+            schema = []
+            for field_name, field_val in vars(default_settings).items():
+                if field_name in ("input_paths", "output_naming_mode", "output_filename_suffix", "output_filename"): continue
+                if isinstance(field_val, bool): var_cls = tk.BooleanVar
+                elif isinstance(field_val, int): var_cls = tk.IntVar
+                elif isinstance(field_val, float): var_cls = tk.DoubleVar
+                else: var_cls = tk.StringVar
+                schema.append((f"{field_name}_var", field_name, var_cls))
+            cls._SETTINGS_SCHEMA = tuple(schema)
+        return cls._SETTINGS_SCHEMA
+
     def _init_variables_dynamic(self):
         default_settings = self.state_manager.get_settings()
         self.settings_map = {}
@@ -527,28 +861,23 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.settings_map["recursive_scan_var"] = "recursive_scan"
         self.settings_map["overwrite_mode_var"] = "overwrite_mode"
 
-        for field_name, field_val in vars(default_settings).items():
-            if field_name in ["input_paths", "output_naming_mode", "output_filename_suffix", "output_filename"]: continue
-            
-            tk_var_name = f"{field_name}_var"
-            
-            if isinstance(field_val, bool):
-                setattr(self, tk_var_name, tk.BooleanVar(value=field_val))
-            elif isinstance(field_val, int):
-                setattr(self, tk_var_name, tk.IntVar(value=field_val))
-            elif isinstance(field_val, float):
-                setattr(self, tk_var_name, tk.DoubleVar(value=field_val))
-            else:
-                val = str(field_val) if field_val is not None else ""
-                setattr(self, tk_var_name, tk.StringVar(value=val))
-            
+        for tk_var_name, field_name, var_cls in self._settings_schema(default_settings):
+            val = getattr(default_settings, field_name)
+            if var_cls is tk.StringVar:
+                val = str(val) if val is not None else ""
+            setattr(self, tk_var_name, var_cls(value=val))
             self.settings_map[tk_var_name] = field_name
         
-        try:
-            has_gpu = DependencyManager.video_processing.VideoUtils.check_ffmpeg_gpu(logging.getLogger())
-            if hasattr(self, "use_gpu_var"):
-                self.use_gpu_var.set(has_gpu)
-        except Exception: pass
+        # `ffmpeg -hwaccels` can take a while on a cold start; ask it off the UI thread.
+        # The answer only seeds the default, so a saved use_gpu choice wins.
+        self._gpu_default_pending = hasattr(self, "use_gpu_var")
+        if self._gpu_default_pending:
+            threading.Thread(target=self._probe_gpu_default, daemon=True).start()
+
+    def _probe_gpu_default(self):
+        try: has_gpu = DependencyManager.video_processing.VideoUtils.check_ffmpeg_gpu(logging.getLogger())
+        except Exception: return
+        self.queue.put(("gpu_probe", has_gpu))
 
     def _build_sidebar(self):
         self.sidebar_frame = ctk.CTkScrollableFrame(self, width=350, corner_radius=0, fg_color=Theme.BG_SECONDARY)
@@ -629,9 +958,9 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         for i, (num, title, desc, color) in enumerate(steps):
             f = ctk.CTkFrame(workflow_frame, fg_color="transparent")
             f.grid(row=0, column=i, padx=40)
-            ctk.CTkLabel(f, text=num, font=("Roboto", 40, "bold"), text_color=color).pack()
+            ctk.CTkLabel(f, text=num, font=Theme.FONT_STEP, text_color=color).pack()
             ctk.CTkLabel(f, text=title, font=Theme.FONT_BOLD, text_color=Theme.TEXT_MAIN).pack()
-            ctk.CTkLabel(f, text=desc, font=("Roboto", 12), text_color=Theme.TEXT_MUTED).pack()
+            ctk.CTkLabel(f, text=desc, font=Theme.FONT_BODY, text_color=Theme.TEXT_MUTED).pack()
             
         if self.dnd_active:
             try:
@@ -664,41 +993,40 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         # Formula: Total Width = (Cols * CellW) + ((Cols + 1) * Gap)
         cell_w = (w - (gap * (cols + 1))) / cols
         cell_h = (h - (gap * (rows + 1))) / rows
+        tc_h = cell_h * 0.15 # Timecode strip: 15% height
         
-        for r in range(rows):
-            for c in range(cols):
-                # Calculate coordinates
-                x1 = gap + c * (cell_w + gap)
-                y1 = gap + r * (cell_h + gap)
-                x2 = x1 + cell_w
-                y2 = y1 + cell_h
-                
-                # Draw the "Video Frame"
-                self.hero_canvas.create_rectangle(x1, y1, x2, y2, fill=color_frame, outline="")
-                
-                # Draw a subtle "Timecode/Metadata" strip at the bottom of each frame
-                # This makes it look like a technical tool, not just boxes
-                tc_h = cell_h * 0.15 # 15% height
-                tc_y1 = y2 - tc_h
-                
-                self.hero_canvas.create_rectangle(x1, tc_y1, x2, y2, fill=color_tc, outline="")
-                
-                # Draw a tiny "cyan accent" on the first frame to suggest "Selection" or "Start"
-                if r == 0 and c == 0:
-                    self.hero_canvas.create_rectangle(x1, y2-2, x1 + (cell_w * 0.3), y2, fill=color_highlight, outline="")
+        # Precompute every cell's corners in one pass (row-major order)
+        x1_grid, y1_grid = np.meshgrid(gap + np.arange(cols) * (cell_w + gap),
+                                       gap + np.arange(rows) * (cell_h + gap))
+        x1s = x1_grid.ravel().tolist()
+        y1s = y1_grid.ravel().tolist()
+        
+        for x1, y1 in zip(x1s, y1s):
+            x2 = x1 + cell_w
+            y2 = y1 + cell_h
+            
+            # Draw the "Video Frame"
+            self.hero_canvas.create_rectangle(x1, y1, x2, y2, fill=color_frame, outline="")
+            
+            # Draw a subtle "Timecode/Metadata" strip at the bottom of each frame
+            # This makes it look like a technical tool, not just boxes
+            self.hero_canvas.create_rectangle(x1, y2 - tc_h, x2, y2, fill=color_tc, outline="")
+        
+        # Draw a tiny "cyan accent" on the first frame to suggest "Selection" or "Start"
+        x1, y2 = x1s[0], y1s[0] + cell_h
+        self.hero_canvas.create_rectangle(x1, y2-2, x1 + (cell_w * 0.3), y2, fill=color_highlight, outline="")
 
     def _create_grid_controller(self, parent):
         self.live_math_frame = ctk.CTkFrame(parent, fg_color=Theme.PANEL_SOFT, corner_radius=8)
         self.live_math_frame.pack(fill="x", padx=10, pady=20)
-        font_lg = ("Roboto", 32, "bold")
-        
-        self.math_lbl_cols = ctk.CTkLabel(self.live_math_frame, text="5", font=font_lg, text_color="white")
+        self._last_math = (None, None)  # Fresh labels, so the next update must paint them
+        self.math_lbl_cols = ctk.CTkLabel(self.live_math_frame, text="5", font=Theme.FONT_MATH, text_color="white")
         self.math_lbl_cols.pack(side="left", expand=True)
-        ctk.CTkLabel(self.live_math_frame, text="x", font=("Roboto", 24), text_color=Theme.TEXT_MUTED).pack(side="left")
-        self.math_lbl_rows = ctk.CTkLabel(self.live_math_frame, text="?", font=font_lg, text_color="white")
+        ctk.CTkLabel(self.live_math_frame, text="x", font=Theme.FONT_MATH_OP, text_color=Theme.TEXT_MUTED).pack(side="left")
+        self.math_lbl_rows = ctk.CTkLabel(self.live_math_frame, text="?", font=Theme.FONT_MATH, text_color="white")
         self.math_lbl_rows.pack(side="left", expand=True)
-        ctk.CTkLabel(self.live_math_frame, text="=", font=("Roboto", 24), text_color=Theme.TEXT_MUTED).pack(side="left")
-        self.math_lbl_res = ctk.CTkLabel(self.live_math_frame, text="?", font=font_lg, text_color=Theme.ACTION_GOLD)
+        ctk.CTkLabel(self.live_math_frame, text="=", font=Theme.FONT_MATH_OP, text_color=Theme.TEXT_MUTED).pack(side="left")
+        self.math_lbl_res = ctk.CTkLabel(self.live_math_frame, text="?", font=Theme.FONT_MATH, text_color=Theme.ACTION_GOLD)
         self.math_lbl_res.pack(side="left", expand=True)
 
         self.input_tabs = ctk.CTkTabview(parent, fg_color=Theme.PANEL, text_color=Theme.TEXT_MAIN,
@@ -768,6 +1096,7 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
 
     def _create_cyber_slider_section(self, parent):
         self.slider_frame = ctk.CTkFrame(parent, fg_color=Theme.PANEL, corner_radius=8)
+        self._vis_state = None  # Freshly built frames use their default packing; the next update must re-place them
         self.slider_frame.pack(fill="x", padx=10, pady=10)
         
         ctk.CTkLabel(self.slider_frame, text="COLUMNS", font=Theme.FONT_BOLD, text_color=Theme.TEXT_MAIN).pack(anchor="w")
@@ -776,6 +1105,7 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                                        button_color=Theme.ACCENT_BLUE, button_hover_color=Theme.ACCENT_BLUE_HOVER)
         self.col_slider.set(5)
         self.col_slider.pack(fill="x", pady=(0, 15))
+        self.col_slider.bind("<ButtonRelease-1>", lambda e: self._schedule_refresh())
         
         ctk.CTkLabel(self.slider_frame, text="ROWS", font=Theme.FONT_BOLD, text_color=Theme.TEXT_MAIN).pack(anchor="w")
         self.row_slider = ctk.CTkSlider(self.slider_frame, from_=1, to=20, number_of_steps=19, variable=None,
@@ -783,11 +1113,12 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                                        button_color=Theme.ACCENT_GREEN, button_hover_color=Theme.ACCENT_GREEN_HOVER)
         self.row_slider.set(5)
         self.row_slider.pack(fill="x", pady=(0, 15))
+        self.row_slider.bind("<ButtonRelease-1>", lambda e: self._schedule_refresh())
 
     def _populate_dimensions_settings(self, parent):
         # Fit Toggle
         self.fit_switch = ctk.CTkSwitch(parent, text="Force Fit to Resolution", variable=self.fit_to_output_params_var, 
-                                        progress_color=Theme.ACCENT_GREEN, command=self.quick_refresh_layout)
+                                        progress_color=Theme.ACCENT_GREEN, command=self._schedule_refresh)
         self.fit_switch.pack(anchor="w", pady=(5, 10))
 
         # Resolution Inputs
@@ -797,14 +1128,16 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         ctk.CTkLabel(res_frame, text="Width:").pack(side="left", padx=(0,5))
         w_entry = ctk.CTkEntry(res_frame, textvariable=self.output_width_var, width=70)
         w_entry.pack(side="left", padx=(0,15))
-        w_entry.bind("<Return>", lambda e: self.quick_refresh_layout())
+        w_entry.bind("<Return>", lambda e: self._schedule_refresh())
+        w_entry.bind("<FocusOut>", lambda e: self._schedule_refresh())
 
         ctk.CTkLabel(res_frame, text="Height:").pack(side="left", padx=(0,5))
         h_entry = ctk.CTkEntry(res_frame, textvariable=self.output_height_var, width=70)
         h_entry.pack(side="left")
-        h_entry.bind("<Return>", lambda e: self.quick_refresh_layout())
+        h_entry.bind("<Return>", lambda e: self._schedule_refresh())
+        h_entry.bind("<FocusOut>", lambda e: self._schedule_refresh())
 
-        ctk.CTkLabel(parent, text="Thumbnails will crop to fit exactly.", font=("Roboto", 10), text_color=Theme.TEXT_MUTED).pack(anchor="w", pady=(5,0))
+        ctk.CTkLabel(parent, text="Thumbnails will crop to fit exactly.", font=Theme.FONT_SMALL, text_color=Theme.TEXT_MUTED).pack(anchor="w", pady=(5,0))
 
     def _populate_advanced_settings(self, parent):
         ctk.CTkLabel(parent, text="UI Theme:").pack(anchor="w", pady=(5, 0))
@@ -895,29 +1228,32 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.overwrite_seg.pack(fill="x", pady=5)
 
 
-        ctk.CTkSwitch(parent, text="Show Frame Info/Timecode", variable=self.frame_info_show_var, progress_color=Theme.ACCENT_GREEN, command=self.quick_refresh_layout).pack(anchor="w", pady=5)
+        ctk.CTkSwitch(parent, text="Show Frame Info/Timecode", variable=self.frame_info_show_var, progress_color=Theme.ACCENT_GREEN, command=self._schedule_refresh).pack(anchor="w", pady=5)
         ctk.CTkCheckBox(parent, text="Detect Faces", variable=self.detect_faces_var, fg_color=Theme.ACCENT_GREEN, hover_color=Theme.ACCENT_GREEN_HOVER).pack(anchor="w", pady=2)
         ctk.CTkCheckBox(parent, text="Use GPU (FFmpeg)", variable=self.use_gpu_var, fg_color=Theme.ACCENT_GREEN, hover_color=Theme.ACCENT_GREEN_HOVER).pack(anchor="w", pady=2)
-        ctk.CTkCheckBox(parent, text="Show Header (Filename)", variable=self.show_header_var, fg_color=Theme.ACCENT_GREEN, hover_color=Theme.ACCENT_GREEN_HOVER, command=self.quick_refresh_layout).pack(anchor="w", pady=2)
-        ctk.CTkCheckBox(parent, text="Show Timecode", variable=self.show_timecode_var, fg_color=Theme.ACCENT_GREEN, hover_color=Theme.ACCENT_GREEN_HOVER, command=self.quick_refresh_layout).pack(anchor="w", pady=2)
+        ctk.CTkCheckBox(parent, text="Show Header (Filename)", variable=self.show_header_var, fg_color=Theme.ACCENT_GREEN, hover_color=Theme.ACCENT_GREEN_HOVER, command=self._schedule_refresh).pack(anchor="w", pady=2)
+        ctk.CTkCheckBox(parent, text="Show Timecode", variable=self.show_timecode_var, fg_color=Theme.ACCENT_GREEN, hover_color=Theme.ACCENT_GREEN_HOVER, command=self._schedule_refresh).pack(anchor="w", pady=2)
         
         ctk.CTkLabel(parent, text="Rotate Thumbnails:").pack(anchor="w", pady=(10, 0))
         self.rotate_seg = ctk.CTkSegmentedButton(parent, values=["0", "90", "180", "270"], variable=self.rotate_thumbnails_var,
                                                  selected_color=Theme.ACCENT_BLUE, selected_hover_color=Theme.ACCENT_BLUE_HOVER,
-                                                 command=self.quick_refresh_layout)
+                                                 command=self._schedule_refresh)
         self.rotate_seg.pack(fill="x", pady=5)
         
         ctk.CTkLabel(parent, text="Corner Roundness:").pack(anchor="w", pady=(10,0))
-        ctk.CTkSlider(parent, from_=0, to=100, variable=self.rounded_corners_var, progress_color=Theme.ACCENT_GREEN, command=self.quick_refresh_layout).pack(fill="x", pady=5)
+        corners_slider = ctk.CTkSlider(parent, from_=0, to=100, variable=self.rounded_corners_var, progress_color=Theme.ACCENT_GREEN)
+        corners_slider.pack(fill="x", pady=5)
+        corners_slider.bind("<ButtonRelease-1>", lambda e: self._schedule_refresh())
         
         ctk.CTkLabel(parent, text="Padding:").pack(anchor="w", pady=(10, 0))
         pad_entry = ctk.CTkEntry(parent, textvariable=self.padding_var)
         pad_entry.pack(fill="x", pady=5)
-        pad_entry.bind("<Return>", lambda e: self.quick_refresh_layout()) 
+        pad_entry.bind("<Return>", lambda e: self._schedule_refresh())
+        pad_entry.bind("<FocusOut>", lambda e: self._schedule_refresh())
 
         ctk.CTkLabel(parent, text="Background Color:").pack(anchor="w", pady=(10,0))
         ctk.CTkEntry(parent, textvariable=self.background_color_var).pack(fill="x", pady=5)
-        ctk.CTkButton(parent, text="Pick Color", command=lambda: [self.pick_bg_color(), self.quick_refresh_layout()],
+        ctk.CTkButton(parent, text="Pick Color", command=lambda: [self.pick_bg_color(), self._schedule_refresh()],
                       width=90, fg_color=Theme.BUTTON_SUBTLE, hover_color=Theme.BUTTON_SUBTLE_HOVER).pack(anchor="w")
 
         ctk.CTkLabel(parent, text="Output Format:").pack(anchor="w", pady=(10, 0))
@@ -934,7 +1270,7 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
 
     def _populate_hdr_settings(self, parent):
         ctk.CTkLabel(parent, text="HDR to SDR Tone Mapping", font=Theme.FONT_BOLD).pack(anchor="w", pady=(5,0))
-        ctk.CTkLabel(parent, text="Converts washed-out HDR colors to normal SDR.", font=("Roboto", 10), text_color=Theme.TEXT_MUTED).pack(anchor="w", pady=(0,5))
+        ctk.CTkLabel(parent, text="Converts washed-out HDR colors to normal SDR.", font=Theme.FONT_SMALL, text_color=Theme.TEXT_MUTED).pack(anchor="w", pady=(0,5))
         self.hdr_switch = ctk.CTkSwitch(parent, text="Enable Tone Mapping", variable=self.hdr_tonemap_var, progress_color=Theme.ACTION_GOLD, command=self._toggle_hdr_options)
         self.hdr_switch.pack(anchor="w", pady=5)
         self.hdr_algo_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -1012,17 +1348,66 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
             self.input_entry.configure(state="normal", fg_color=Theme.PANEL_SOFT)
 
     def _bind_settings_to_state(self):
+        # Trace callbacks hold only a weak reference so Tcl commands don't pin the app.
+        # Each one is a closure specialised to its variable: a trace fire costs one
+        # weakref call and a set insert, and the value itself is read at flush time
+        # through the pre-bound var.get.
+        app_ref = weakref.ref(self)
+
+        def make_on_write(var_name):
+            def on_write(*args):
+                app = app_ref()
+                if app is not None: app._schedule_settings_flush(var_name)
+            return on_write
+
         for var_name, setting_key in self.settings_map.items():
             if hasattr(self, var_name):
                 var = getattr(self, var_name)
-                var.trace_add("write", lambda *args, v=var_name, s=setting_key: self._on_setting_change(v, s))
+                self._bound_settings[var_name] = (var.get, setting_key)
+                var.trace_add("write", make_on_write(var_name))
+
+    def _schedule_settings_flush(self, var_name):
+        """Mark a setting dirty and sync all pending changes once per 50 ms."""
+        self._dirty_settings.add(var_name)
+        if self._settings_modify_depth == 0 and self._settings_flush_id is None:
+            self._settings_flush_id = self.after(50, self._flush_settings)
 
-    def _on_setting_change(self, var_name, setting_key):
+    @contextlib.contextmanager
+    def _modifying_settings(self, sync_state: bool = True):
+        """StartModify/EndModify bracket for bulk variable writes.
+
+        Writes inside the bracket are applied with one flush when it closes, or
+        dropped when sync_state is False because the values came from the state.
+        """
+        if self._settings_modify_depth == 0:
+            self._flush_settings()
+        self._settings_modify_depth += 1
         try:
-            var = getattr(self, var_name)
-            val = var.get()
-            self.state_manager.update_settings({setting_key: val}, commit=False)
-        except Exception: pass
+            yield
+        finally:
+            self._settings_modify_depth -= 1
+            if self._settings_modify_depth == 0:
+                if sync_state:
+                    self._flush_settings()
+                else:
+                    self._dirty_settings.clear()
+
+    def _flush_settings(self):
+        if self._settings_flush_id is not None:
+            self.after_cancel(self._settings_flush_id)
+            self._settings_flush_id = None
+        dirty, self._dirty_settings = self._dirty_settings, set()
+        settings_update = {}
+        bound = self._bound_settings
+        for var_name in dirty:
+            get, setting_key = bound[var_name]
+            try: settings_update[setting_key] = get()
+            except Exception: pass
+        if settings_update:
+            self.state_manager.update_settings(settings_update, commit=False)
+            if not self._loading_persistent_settings:
+                self._save_persistent_settings()
+        self._update_live_math()
 
     def _on_ui_theme_change(self, value):
         if self._loading_persistent_settings or self._applying_theme:
@@ -1054,35 +1439,36 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         try:
             cols = int(self.num_columns_var.get())
             rows = int(self.num_rows_var.get() or 5)
-            self.math_lbl_cols.configure(text=str(cols))
-            self.math_lbl_rows.configure(text=str(rows))
-            self.math_lbl_res.configure(text=str(cols * rows))
-        except Exception: pass
+        except (ValueError, tk.TclError): return
+        # Every settings flush lands here; only repaint the labels when the numbers actually move.
+        if (cols, rows) == self._last_math: return
+        self._last_math = (cols, rows)
+        self.math_lbl_cols.configure(text=str(cols))
+        self.math_lbl_rows.configure(text=str(rows))
+        self.math_lbl_res.configure(text=str(cols * rows))
 
     def perform_undo(self, event=None):
+        self._flush_settings()
         new_state = self.state_manager.undo()
         if new_state: self.refresh_ui_from_state(new_state)
 
     def perform_redo(self, event=None):
+        self._flush_settings()
         new_state = self.state_manager.redo()
         if new_state: self.refresh_ui_from_state(new_state)
 
     def refresh_ui_from_state(self, state):
         settings = state.settings
-        for var_name, setting_key in self.settings_map.items():
-            if hasattr(self, var_name) and hasattr(settings, setting_key):
-                val = getattr(settings, setting_key)
-                if setting_key == "input_paths" and isinstance(val, list): val = "; ".join(val)
-                getattr(self, var_name).set(val)
+        with self._modifying_settings(sync_state=False):
+            for var_name, setting_key in self.settings_map.items():
+                if hasattr(self, var_name) and hasattr(settings, setting_key):
+                    val = getattr(settings, setting_key)
+                    if setting_key == "input_paths" and isinstance(val, list): val = "; ".join(val)
+                    getattr(self, var_name).set(val)
         try:
             self.col_slider.set(settings.num_columns)
             self.row_slider.set(settings.num_rows)
-            if hasattr(self, 'layout_mode_seg'): self.layout_mode_seg.set(self.layout_mode_var.get())
-            if hasattr(self, 'extraction_mode_seg'): self.extraction_mode_seg.set(self.extraction_mode_var.get())
-            if hasattr(self, 'ui_theme_seg'): self.ui_theme_seg.set(self.ui_theme_var.get())
-            if hasattr(self, 'rotate_seg'): self.rotate_seg.set(str(self.rotate_thumbnails_var.get()))
-            if hasattr(self, 'format_seg'): self.format_seg.set(self.frame_format_var.get())
-            if hasattr(self, 'overwrite_seg'): self.overwrite_seg.set(self.overwrite_mode_var.get())
+            self._sync_segmented_buttons()
         except AttributeError: pass
         self.update_visibility_state()
         self._toggle_naming_inputs()
@@ -1091,13 +1477,17 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
             self._restore_grid_visuals(state, settings)
         self._update_live_math()
 
+    def _sync_segmented_buttons(self):
+        for seg_name, var_name in self._SEGMENTED_WIDGETS:
+            seg = getattr(self, seg_name, None)
+            if seg is not None: seg.set(str(getattr(self, var_name).get()))
+
     def _restore_grid_visuals(self, state, settings):
+        self._refresh_gen += 1  # An in-flight refresh belongs to the pre-undo state
         image_source_data = self._preview_image_source_data(state.thumbnail_metadata, settings.layout_mode)
-        grid_path = os.path.join(self.preview_temp_dir, "preview_restored.jpg")
         
         grid_params = {
             'image_source_data': image_source_data,
-            'output_path': grid_path,
             'columns': settings.num_columns,
             'rows': settings.num_rows,
             'background_color_hex': settings.background_color,
@@ -1116,13 +1506,79 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
             'output_height': settings.output_height,
         }
 
-        success, layout = DependencyManager.image_grid.create_image_grid(**grid_params)
-        
-        self.state_manager.get_state().thumbnail_layout_data = layout
-        if success:
-            self.preview_zoomable_canvas.set_image(grid_path)
+        grid_key = self._grid_cache_key(grid_params)
+        if grid_key == self._last_grid_key:
+            return
+        cached = self._grid_cache.get(grid_key)
+        if cached is not None:
+            self._last_grid_key = grid_key
+            self.state_manager.get_state().thumbnail_layout_data = cached[1]
+            self._show_grid(grid_key, *cached)
+            return
+        # Compose on the refresh worker so undo/redo stays responsive; the restored
+        # vars already hold these settings, so a queued refresh renders the same grid.
+        if self._refresh_running:
+            self._refresh_pending = True
+            return
+        self._refresh_running = True
+        threading.Thread(
+            target=self._refresh_worker,
+            args=(self._refresh_gen, grid_key, grid_params),
+            daemon=True
+        ).start()
+
+    def _show_grid(self, grid_key, grid_image, layout):
+        """Display a composed grid and keep it for undo/redo; the canvas gets a copy
+        because scrubbing pastes new frames into the displayed image."""
+        cache = self._grid_cache
+        cache[grid_key] = (grid_image, layout)
+        cache.move_to_end(grid_key)
+        pixels = sum(img.width * img.height for img, _ in cache.values())
+        while len(cache) > 1 and (len(cache) > GRID_CACHE_SIZE or pixels > GRID_CACHE_PIXELS):
+            img, _ = cache.popitem(last=False)[1]
+            pixels -= img.width * img.height
+        self.preview_zoomable_canvas.set_image(grid_image.copy())
 
-    def _preview_image_source_data(self, metadata, layout_mode):
+    @staticmethod
+    def _grid_cache_key(grid_params):
+        """Hashable summary of everything that affects a rendered preview grid."""
+        sources = tuple(
+            tuple(sorted(kv for kv in item.items() if kv[0] != 'image'))
+            for item in grid_params['image_source_data']
+        )
+        options = tuple(sorted(
+            (k, v) for k, v in grid_params.items()
+            if k not in ('image_source_data', 'output_path', 'logger')
+        ))
+        return sources, options
+
+    def _load_thumb(self, path):
+        """Decoded preview frame from an LRU keyed by (path, mtime); None if unreadable."""
+        try: key = (path, os.stat(path).st_mtime_ns)
+        except (OSError, TypeError): return None
+        with self._thumb_cache_lock:
+            img = self._thumb_cache.get(key)
+            if img is not None:
+                self._thumb_cache.move_to_end(key)
+                return img
+        try:
+            with Image.open(path) as src: img = src.convert("RGB")
+        except Exception: return None
+        with self._thumb_cache_lock:
+            self._thumb_cache[key] = img
+            while len(self._thumb_cache) > THUMB_CACHE_SIZE: self._thumb_cache.popitem(last=False)
+        return img
+
+    def _attach_cached_thumbs(self, image_source_data):
+        # create_image_grid composites an attached 'image' instead of decoding the file again.
+        for entry in image_source_data:
+            if 'image' not in entry:
+                img = self._load_thumb(entry.get('image_path'))
+                if img is not None: entry['image'] = img
+
+    def _preview_image_source_data(self, metadata, layout_mode, decoded=None):
+        # decoded maps frame_path -> BGR array already in memory, sparing the grid a re-read.
+        decoded = decoded or {}
         image_source_data = []
         for item in metadata or []:
             entry = {
@@ -1133,40 +1589,81 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
             }
             if layout_mode == 'timeline':
                 entry['width_ratio'] = item.get('duration_frames', 1.0)
+            if entry['image_path'] in decoded:
+                entry['image'] = decoded[entry['image_path']]
             image_source_data.append(entry)
         return image_source_data
 
     # --- ACTION HANDLERS ---
     def _start_queue_poller(self):
+        """Dispatch up to QUEUE_BATCH_LIMIT worker messages, then repaint once."""
+        handled = 0
+        pending_thumbs = {}  # index -> newest update_thumbnail payload
+        # Newest "progress" / "log" payloads, in arrival order: both only rewrite the
+        # status line (and bar), so earlier ones in a run would never be seen.
+        pending_status = {}
         try:
-            while True:
+            while handled < QUEUE_BATCH_LIMIT:
                 msg_type, data = self.queue.get_nowait()
-                if msg_type == "log":
-                    self.status_lbl.configure(text=data)
-                elif msg_type == "progress":
-                    current, total, fname = data
-                    if total > 0:
-                        self.progress_bar.set(current / total)
-                        if self.input_tabs.get() == "Batch Queue":
-                            self.status_lbl.configure(text=f"Batch: {current}/{total} | {fname}")
-                        else:
-                            self.status_lbl.configure(text=f"Processing {current}/{total}...")
-                    else: self.status_lbl.configure(text="Processing Complete.")
-                elif msg_type == "preview_done":
-                    self._handle_preview_done(data)
-                elif msg_type == "preview_failed":
-                    self._handle_preview_failed(data)
-                elif msg_type == "preview_cancelled":
-                    self._handle_preview_cancelled()
-                elif msg_type == "generation_done":
-                    self._handle_generation_done(data)
-                elif msg_type == "update_thumbnail":
-                    self.update_thumbnail_in_preview(data['index'], data['image'], data['timestamp'])
-                elif msg_type == "busy":
-                    self._set_busy(bool(data))
-                self.update_idletasks()
+                handled += 1
+                if msg_type == "update_thumbnail":
+                    pending_thumbs[data['index']] = data
+                    continue
+                if msg_type in ("progress", "log"):
+                    pending_status.pop(msg_type, None)
+                    pending_status[msg_type] = data
+                    continue
+                # Keep ordering: thumbnails and status queued before e.g. preview_done land first.
+                self._apply_thumbnail_updates(pending_thumbs)
+                self._apply_status_updates(pending_status)
+                self._dispatch_queue_message(msg_type, data)
         except queue.Empty: pass
-        self.after(100, self._start_queue_poller)
+        self._apply_thumbnail_updates(pending_thumbs)
+        self._apply_status_updates(pending_status)
+        if handled:
+            self.update_idletasks()
+        active = handled or self.is_busy or self._refresh_running or self.scrubbing_handler.active
+        self.after(QUEUE_POLL_MS if active else QUEUE_IDLE_POLL_MS, self._start_queue_poller)
+
+    def _apply_thumbnail_updates(self, pending_thumbs):
+        for data in pending_thumbs.values():
+            self.update_thumbnail_in_preview(data['index'], data['image'], data['timestamp'], data.get('frame_index', -1))
+        pending_thumbs.clear()
+
+    def _apply_status_updates(self, pending_status):
+        for msg_type, data in pending_status.items():
+            self._dispatch_queue_message(msg_type, data)
+        pending_status.clear()
+
+    def _dispatch_queue_message(self, msg_type, data):
+        if msg_type == "log":
+            self.status_lbl.configure(text=data)
+        elif msg_type == "progress":
+            current, total, fname = data
+            if total > 0:
+                self.progress_bar.set(current / total)
+                if self.input_tabs.get() == "Batch Queue":
+                    self.status_lbl.configure(text=f"Batch: {current}/{total} | {fname}")
+                else:
+                    self.status_lbl.configure(text=f"Processing {current}/{total}...")
+            else: self.status_lbl.configure(text="Processing Complete.")
+        elif msg_type == "preview_done":
+            self._handle_preview_done(data)
+        elif msg_type == "refresh_done":
+            self._handle_refresh_done(data)
+        elif msg_type == "preview_failed":
+            self._handle_preview_failed(data)
+        elif msg_type == "preview_cancelled":
+            self._handle_preview_cancelled()
+        elif msg_type == "generation_done":
+            self._handle_generation_done(data)
+        elif msg_type == "update_thumbnail":
+            self.update_thumbnail_in_preview(data['index'], data['image'], data['timestamp'], data.get('frame_index', -1))
+        elif msg_type == "busy":
+            self._set_busy(bool(data))
+        elif msg_type == "gpu_probe":
+            if self._gpu_default_pending: self.use_gpu_var.set(bool(data))
+            self._gpu_default_pending = False
 
     def start_thumbnail_preview_generation(self):
         if self.is_busy:
@@ -1176,11 +1673,9 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
             messagebox.showinfo("Mode Info", "Switch to 'Single Source' tab to preview tweaks.")
             return
 
-        input_paths = [p.strip() for p in self.input_paths_var.get().split(';') if p.strip()]
-        if not input_paths:
+        if not self._current_input_paths():
             messagebox.showerror("Preview Error", "Choose a video file before generating a preview.")
             return
-        self._internal_input_paths = input_paths
         
         # --- NEW: Check if input is directory and resolve to first video ---
         preview_target_path = self._internal_input_paths[0]
@@ -1196,12 +1691,14 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                 messagebox.showerror("Preview Error", "No video files found in the selected directory.")
                 return
 
-        if self.preview_temp_dir and os.path.exists(self.preview_temp_dir):
-            self.temp_dirs_to_cleanup.append(self.preview_temp_dir)
-            
-        new_temp_dir = tempfile.mkdtemp(prefix="movieprint_preview_")
+        # One scratch dir per source, reused by later previews of it: the extractors
+        # overwrite frames with -y / os.replace and clear their own stale files first.
+        # All of them go on exit.
+        new_temp_dir = self._preview_dirs.get(preview_target_path)
+        if not new_temp_dir or not os.path.isdir(new_temp_dir):
+            new_temp_dir = tempfile.mkdtemp(prefix="movieprint_preview_")
+            self._preview_dirs[preview_target_path] = new_temp_dir
         self.preview_temp_dir = new_temp_dir
-        self._cleanup_garbage_dirs()
         
         preview_settings = {
             'extraction_mode': self.extraction_mode_var.get(),
@@ -1216,6 +1713,7 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
             'rounded': int(self.rounded_corners_var.get()),
             'show_header': self.show_header_var.get(),
             'target_row_height': int(self.target_row_height_var.get() or 150),
+            'preview_width': self._preview_frame_width(),
             'frame_info_show': self.frame_info_show_var.get(),
             'hdr_tonemap': self.hdr_tonemap_var.get(),
             'hdr_algorithm': self.hdr_algorithm_var.get(),
@@ -1238,9 +1736,26 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
             daemon=True
         ).start()
 
+    def _preview_frame_width(self):
+        """Width FFmpeg scales preview frames to: Preview Quality 50 keeps the classic
+        480 px, and a fitted grid never decodes wider than its cells need."""
+        try: quality = max(10, min(100, int(self.preview_quality_var.get())))
+        except (ValueError, tk.TclError): quality = 50
+        width = 960 * quality // 100
+        if self.fit_to_output_params_var.get() and self.layout_mode_var.get() == "grid":
+            try:
+                cols = max(1, int(self.num_columns_var.get()))
+                rows = max(1, int(self.num_rows_var.get()))
+                cell = max(int(self.output_width_var.get()) // cols, int(self.output_height_var.get()) // rows)
+                # Cells crop-fill: a 16:9 frame, upright or rotated, must still cover the cell.
+                width = min(width, max(160, cell * 16 // 9))
+            except (ValueError, tk.TclError): pass
+        return width
+
     def _thumbnail_preview_thread(self, video_path, temp_dir, config):
-        logger = logging.getLogger(f"preview_{threading.get_ident()}")
-        logger.addHandler(QueueHandler(self.queue))
+        logger = logging.getLogger("gui_preview")
+        status_handler = StatusQueueHandler(self.queue)
+        logger.addHandler(status_handler)
         meta = []
         success = False
         failure_reason = None
@@ -1259,16 +1774,10 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                 if not success: self.queue.put(("log", "Shot detection failed (is PySceneDetect installed?)"))
 
             else:
-                duration = 600
-                cap = DependencyManager.video_processing.cv2.VideoCapture(video_path)
-                if cap.isOpened():
-                    fps = cap.get(DependencyManager.video_processing.cv2.CAP_PROP_FPS)
-                    frames = cap.get(DependencyManager.video_processing.cv2.CAP_PROP_FRAME_COUNT)
-                    duration = frames / fps if fps > 0 else 600
-                    cap.release()
+                duration = self._probe_duration(video_path, logger) or 600
 
                 total_frames = config['cols'] * config['rows']
-                timestamps = np.linspace(0, duration, total_frames+2)[1:-1]
+                timestamps = np.linspace(0, duration, total_frames+2)[1:-1].tolist()  # Plain floats; already ascending
                 
                 self.queue.put(("log", f"Extracting {total_frames} frames..."))
                 
@@ -1280,27 +1789,27 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                         interval_seconds=interval, 
                         fast_preview=True, 
                         hdr_tonemap=True, 
-                        hdr_algorithm=config['hdr_algorithm']
+                        hdr_algorithm=config['hdr_algorithm'],
+                        preview_width=config['preview_width']
                     )
                     if len(meta) > total_frames: meta = meta[:total_frames]
                 else:
                     success, meta = DependencyManager.video_processing.extract_frames_from_timestamps(
-                        video_path, timestamps, temp_dir, logger, fast_preview=True
+                        video_path, timestamps, temp_dir, logger, fast_preview=True,
+                        preview_width=config['preview_width']
                     )
             
             if config['cancel_event'].is_set():
                 self.queue.put(("preview_cancelled", None))
             elif success and meta:
-                self._process_preview_thumbnails(meta, config, logger)
+                decoded = self._process_preview_thumbnails(meta, config, logger)
 
                 self.queue.put(("log", f"Generating {config['layout_mode']} layout..."))
-                grid_path = os.path.join(temp_dir, "preview_initial.jpg")
                 
-                image_source_data = self._preview_image_source_data(meta, config['layout_mode'])
+                image_source_data = self._preview_image_source_data(meta, config['layout_mode'], decoded)
 
-                grid_success, layout = DependencyManager.image_grid.create_image_grid(
+                grid_image, layout = DependencyManager.image_grid.compose_image_grid(
                     image_source_data=image_source_data,
-                    output_path=grid_path,
                     layout_mode=config['layout_mode'],
                     columns=config['cols'],
                     rows=config['rows'],
@@ -1318,9 +1827,9 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                 
                 if config['cancel_event'].is_set():
                     self.queue.put(("preview_cancelled", None))
-                elif grid_success:
+                elif grid_image is not None:
                     self.queue.put(("preview_done", {
-                        "grid_path": grid_path, "meta": meta,
+                        "grid_image": grid_image, "meta": meta,
                         "layout": layout, "temp_dir": temp_dir
                     }))
                 else:
@@ -1331,56 +1840,91 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
             logger.exception("Preview generation failed")
             failure_reason = str(e)
         finally:
+            logger.removeHandler(status_handler)
             self.queue.put(("progress", (0, 0, "")))
             if failure_reason:
                 self.queue.put(("preview_failed", {"reason": failure_reason}))
             self.queue.put(("busy", False))
 
+    def _probe_duration(self, video_path, logger=None):
+        """Duration in seconds, cached per file version. ffprobe first, OpenCV as fallback."""
+        try: key = (video_path, os.stat(video_path).st_mtime_ns)
+        except OSError: return None
+        duration = self._duration_cache.get(key)
+        if duration is not None: return duration
+
+        vp = DependencyManager.video_processing
+        duration = vp.VideoUtils.probe_duration(video_path, logger)
+        if duration is None:
+            try: _, duration, _ = vp.VideoExtractor(video_path, logger).properties
+            except Exception as e:
+                if logger: logger.warning(f"Could not determine duration: {e}")
+                return None
+        if duration and duration > 0:
+            self._duration_cache[key] = duration
+            return duration
+        return None
+
     def _process_preview_thumbnails(self, meta_list, config, logger):
+        """Post-processes preview frames; returns {frame_path: BGR array} for frames decoded here."""
+        # Rotation is not baked into the preview frames: create_image_grid applies
+        # it in memory while compositing, so refreshes can change it freely.
+        decoded = {}
+        if not config['detect_faces']: return decoded
+
+        self.queue.put(("log", "Detecting faces (Preview)..."))
         cv2 = DependencyManager.video_processing.cv2
-        if config['rotate_thumbnails'] != 0:
-            self.queue.put(("log", "Rotating thumbnails..."))
-            rot_flag = {90: cv2.ROTATE_90_CLOCKWISE, 180: cv2.ROTATE_180, 270: cv2.ROTATE_90_COUNTERCLOCKWISE}.get(config['rotate_thumbnails'])
-            if rot_flag is not None:
-                for item in meta_list:
-                    try:
-                        img = cv2.imread(item['frame_path'])
-                        if img is not None:
-                            img = cv2.rotate(img, rot_flag)
-                            cv2.imwrite(item['frame_path'], img)
-                    except Exception as e:
-                        logger.warning(f"Preview thumbnail rotation failed for {item.get('frame_path')}: {e}")
-        if config['detect_faces']:
-            self.queue.put(("log", "Detecting faces (Preview)..."))
-            cascade_path = os.path.join(cv2.data.haarcascades, 'haarcascade_frontalface_default.xml')
+        cascade_path = os.path.join(cv2.data.haarcascades, 'haarcascade_frontalface_default.xml')
+        if not self._face_cascades:
             face_cascade = cv2.CascadeClassifier(cascade_path)
-            if not face_cascade.empty():
-                for item in meta_list:
-                    try:
-                        img = cv2.imread(item['frame_path'])
-                        if img is None: continue
-                        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-                        faces = face_cascade.detectMultiScale(gray, 1.1, 4)
-                        if len(faces) > 0:
-                            for (x, y, w, h) in faces:
-                                cv2.rectangle(img, (x, y), (x+w, y+h), (0, 255, 0), 2)
-                            cv2.imwrite(item['frame_path'], img)
-                    except Exception as e: logger.warning(f"Face detect error: {e}")
+            if face_cascade.empty():
+                logger.warning("Face detection unavailable: could not load Haar cascade.")
+                return decoded
+            self._face_cascades.append(face_cascade)
+
+        # detectMultiScale releases the GIL but a classifier must not be shared
+        # across threads: each task borrows a parsed one from the pool and hands
+        # it back, so the XML is only parsed again when every pooled one is busy.
+        def mark_faces(item):
+            try: cascade = self._face_cascades.pop()
+            except IndexError: cascade = cv2.CascadeClassifier(cascade_path)
+            try:
+                img = cv2.imread(item['frame_path'])
+                if img is None: return
+                decoded[item['frame_path']] = img
+                gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+                faces = cascade.detectMultiScale(gray, 1.1, 4)
+                if len(faces) > 0:
+                    for (x, y, w, h) in faces:
+                        cv2.rectangle(img, (x, y), (x+w, y+h), (0, 255, 0), 2)
+                    cv2.imwrite(item['frame_path'], img)
+            except Exception as e: logger.warning(f"Face detect error: {e}")
+            finally: self._face_cascades.append(cascade)
+
+        max_workers = max(1, min(4, len(meta_list), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(mark_faces, meta_list))
+        return decoded
 
     def _handle_preview_done(self, data):
-        self.state_manager.get_state().thumbnail_metadata = data.get("meta")
-        self.state_manager.get_state().thumbnail_layout_data = data.get("layout")
+        self._refresh_gen += 1  # Drop any in-flight refresh of the previous preview
+        self._last_grid_key = None
+        self._grid_cache.clear()
+        with self._thumb_cache_lock: self._thumb_cache.clear()  # Frames of the old preview are gone
+        state = self.state_manager.get_state()
+        state.thumbnail_metadata = data.get("meta")
+        state.thumbnail_layout_data = data.get("layout")
         
         if self.is_landing_state:
             self.landing_frame.grid_remove()
             self.preview_zoomable_canvas.grid(row=0, column=0, sticky="nsew")
             self.is_landing_state = False
             
-        if data.get("grid_path"):
-            self.preview_zoomable_canvas.set_image(data.get("grid_path"))
+        if data.get("grid_image") is not None:
+            self.preview_zoomable_canvas.set_image(data.get("grid_image"))
             
         self.progress_bar.stop()
-        self._update_live_math()
+        self._flush_settings()
         self.state_manager.snapshot()
 
     def _handle_preview_failed(self, data):
@@ -1431,33 +1975,87 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.status_lbl.configure(text=summary.split("\n", 1)[0])
         messagebox.showwarning("Generation Completed with Errors", summary)
 
+    def _schedule_refresh(self, value=None):
+        """Re-render the preview once the user stops changing layout controls."""
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(REFRESH_DEBOUNCE_MS, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self):
+        self._refresh_after_id = None
+        self.quick_refresh_layout()
+
     def quick_refresh_layout(self, value=None):
+        """Re-render the preview grid on a worker thread; one render runs at a time."""
         if not self.state_manager.get_state().thumbnail_metadata or not self.preview_temp_dir:
             return
+        if self._refresh_running:
+            self._refresh_gen += 1
+            self._refresh_pending = True
+            return
         meta = self.state_manager.get_state().thumbnail_metadata
         layout_mode = self.layout_mode_var.get()
-        image_source_data = self._preview_image_source_data(meta, layout_mode)
-        grid_path = os.path.join(self.preview_temp_dir, "preview_refresh.jpg")
-        success, layout = DependencyManager.image_grid.create_image_grid(
-            image_source_data=image_source_data,
-            output_path=grid_path,
-            layout_mode=layout_mode,
-            columns=int(self.num_columns_var.get()),
-            rows=int(self.num_rows_var.get()),
-            target_row_height=int(self.target_row_height_var.get() or 150),
-            background_color_hex=self.background_color_var.get(),
-            padding=int(self.padding_var.get()),
-            logger=logging.getLogger("refresh"),
-            rounded_corners=int(self.rounded_corners_var.get()),
-            rotation=int(self.rotate_thumbnails_var.get()),
-            frame_info_show=self.frame_info_show_var.get(),
-            fit_to_output_params=self.fit_to_output_params_var.get(),
-            output_width=int(self.output_width_var.get()),
-            output_height=int(self.output_height_var.get())
-        )
-        if success:
-            self.preview_zoomable_canvas.set_image(grid_path)
-            self.state_manager.get_state().thumbnail_layout_data = layout
+        try:
+            grid_params = dict(
+                image_source_data=self._preview_image_source_data(meta, layout_mode),
+                layout_mode=layout_mode,
+                columns=int(self.num_columns_var.get()),
+                rows=int(self.num_rows_var.get()),
+                target_row_height=int(self.target_row_height_var.get() or 150),
+                background_color_hex=self.background_color_var.get(),
+                padding=int(self.padding_var.get()),
+                logger=logging.getLogger("refresh"),
+                rounded_corners=int(self.rounded_corners_var.get()),
+                rotation=int(self.rotate_thumbnails_var.get()),
+                grid_margin=int(self.grid_margin_var.get()),
+                show_header=self.show_header_var.get(),
+                frame_info_show=self.frame_info_show_var.get(),
+                fit_to_output_params=self.fit_to_output_params_var.get(),
+                output_width=int(self.output_width_var.get()),
+                output_height=int(self.output_height_var.get())
+            )
+        except (ValueError, tk.TclError) as e:
+            self.status_lbl.configure(text=f"Cannot refresh preview: {e}")
+            return
+        grid_key = self._grid_cache_key(grid_params)
+        if grid_key == self._last_grid_key:
+            return
+        cached = self._grid_cache.get(grid_key)
+        if cached is not None:
+            self._refresh_gen += 1
+            self._last_grid_key = grid_key
+            self.state_manager.get_state().thumbnail_layout_data = cached[1]
+            self._show_grid(grid_key, *cached)
+            return
+        self._refresh_gen += 1
+        self._refresh_running = True
+        threading.Thread(
+            target=self._refresh_worker,
+            args=(self._refresh_gen, grid_key, grid_params),
+            daemon=True
+        ).start()
+
+    def _refresh_worker(self, generation, grid_key, grid_params):
+        try:
+            self._attach_cached_thumbs(grid_params['image_source_data'])
+            grid_image, layout = DependencyManager.image_grid.compose_image_grid(**grid_params)
+        except Exception:
+            grid_params['logger'].exception("Preview refresh failed")
+            grid_image, layout = None, []
+        self.queue.put(("refresh_done", {
+            "generation": generation, "grid_key": grid_key,
+            "grid_image": grid_image, "layout": layout
+        }))
+
+    def _handle_refresh_done(self, data):
+        self._refresh_running = False
+        if data["generation"] == self._refresh_gen and data["grid_image"] is not None:
+            self.state_manager.get_state().thumbnail_layout_data = data["layout"]
+            self._last_grid_key = data["grid_key"]
+            self._show_grid(data["grid_key"], data["grid_image"], data["layout"])
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.quick_refresh_layout()
 
     # --- SCRUBBING ---
     def is_scrubbing_active(self): return self.scrubbing_handler.active
@@ -1466,48 +2064,97 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         layout = self.state_manager.get_state().thumbnail_layout_data
         if not layout or not self.preview_zoomable_canvas.original_image: return False
         canvas_x, canvas_y = self.preview_zoomable_canvas.canvas_event_to_image_coords(event)
-        for i, thumb_info in enumerate(layout):
-            if thumb_info['x'] <= canvas_x <= thumb_info['x'] + thumb_info['width'] and \
-               thumb_info['y'] <= canvas_y <= thumb_info['y'] + thumb_info['height']:
-                self.state_manager.snapshot()
-                meta = self.state_manager.get_state().thumbnail_metadata[i]
-                video_path = self._internal_input_paths[0] if self._internal_input_paths else ""
-                self.scrubbing_handler.start(event, i, meta.get('timestamp_sec', 0.0), video_path)
-                return True
-        return False
+        i = self._thumbnail_at(layout, canvas_x, canvas_y)
+        if i < 0: return False
+        self._flush_settings()
+        self.state_manager.snapshot()
+        meta = self.state_manager.get_state().thumbnail_metadata[i]
+        video_path = self._internal_input_paths[0] if self._internal_input_paths else ""
+        self._last_thumb_sig.clear()
+        self._scrub_cells.clear()  # Frame indices are only meaningful for one drag
+        cell = layout[i]
+        # The worker shrinks frames before rotation, so give it the cell in frame orientation.
+        if int(self.rotate_thumbnails_var.get()) in (90, 270): target_size = (cell['height'], cell['width'])
+        else: target_size = (cell['width'], cell['height'])
+        self.scrubbing_handler.start(event, i, meta.get('timestamp_sec', 0.0), video_path, target_size)
+        return True
+
+    def _thumbnail_at(self, layout, x, y):
+        """Index of the first thumbnail whose box contains (x, y), or -1."""
+        cached_layout, boxes = self._layout_boxes
+        if cached_layout is not layout:
+            boxes = np.array([(t['x'], t['y'], t['x'] + t['width'], t['y'] + t['height']) for t in layout], dtype=np.float64)
+            self._layout_boxes = (layout, boxes)
+        if not len(boxes): return -1
+        hits = (boxes[:, 0] <= x) & (x <= boxes[:, 2]) & (boxes[:, 1] <= y) & (y <= boxes[:, 3])
+        return int(hits.argmax()) if hits.any() else -1
     def handle_scrubbing(self, event): self.scrubbing_handler.handle_motion(event)
     def stop_scrubbing(self, event): self.scrubbing_handler.stop(event)
-    def update_thumbnail_in_preview(self, index, new_thumb_img, new_timestamp):
+    def _rounded_corner_mask(self, size, radius):
+        """Scrubbing repaints the same cell size over and over, so keep its mask around."""
+        key = (size[0], size[1], radius)
+        mask = self._rc_mask_cache.get(key)
+        if mask is not None:
+            self._rc_mask_cache.move_to_end(key)
+            return mask
+        mask = Image.new('L', size, 0)
+        ImageDraw.Draw(mask).rounded_rectangle([(0, 0), size], radius=radius, fill=255)
+        self._rc_mask_cache[key] = mask
+        if len(self._rc_mask_cache) > CORNER_MASK_CACHE_SIZE: self._rc_mask_cache.popitem(last=False)
+        return mask
+
+    def _compose_scrub_cell(self, img, width, height, rot_val, fit, radius):
+        # Clockwise quarter turns, same mapping as image_grid's final render.
+        if rot_val == 90: img = img.transpose(Image.Transpose.ROTATE_270)
+        elif rot_val == 180: img = img.transpose(Image.Transpose.ROTATE_180)
+        elif rot_val == 270: img = img.transpose(Image.Transpose.ROTATE_90)
+
+        # Use same fit logic for live update if enabled
+        if img.size == (width, height):
+            cell = img  # The scrub worker already shrank it to the cell
+        elif fit:
+            cell = ImageOps.fit(img, (width, height), method=Image.Resampling.NEAREST)
+        else:
+            cell = img.resize((width, height), Image.Resampling.NEAREST)
+
+        if radius > 0:
+            mask = self._rounded_corner_mask(cell.size, radius)
+            if cell.mode == "RGBA":
+                cell.putalpha(ImageChops.multiply(cell.getchannel("A"), mask))
+            else:
+                # Opaque frame: the mask *is* the alpha, no multiply needed.
+                cell = cell.convert("RGBA")
+                cell.putalpha(mask)
+        return cell
+
+    def update_thumbnail_in_preview(self, index, new_thumb_img, new_timestamp, frame_index=-1):
         try: self.state_manager.get_state().thumbnail_metadata[index]['timestamp_sec'] = new_timestamp
         except IndexError: pass
         canvas_handler = self.preview_zoomable_canvas
+        self._last_grid_key = None  # The displayed grid no longer matches any render
         layout = self.state_manager.get_state().thumbnail_layout_data
         if not canvas_handler.original_image or index >= len(layout): return
         try:
             thumb_info = layout[index]
             rot_val = int(self.rotate_thumbnails_var.get())
-            if rot_val == 90: new_thumb_img = new_thumb_img.rotate(-90, expand=True)
-            elif rot_val == 180: new_thumb_img = new_thumb_img.rotate(180)
-            elif rot_val == 270: new_thumb_img = new_thumb_img.rotate(-270, expand=True)
-            
-            # Use same fit logic for live update if enabled
             fit = self.fit_to_output_params_var.get()
-            if fit:
-                resized = ImageOps.fit(new_thumb_img, (thumb_info['width'], thumb_info['height']), method=Image.Resampling.NEAREST)
-            else:
-                resized = new_thumb_img.resize((thumb_info['width'], thumb_info['height']), Image.Resampling.NEAREST)
-
             radius = int(self.rounded_corners_var.get())
-            if radius > 0:
-                resized = resized.convert("RGBA")
-                mask = Image.new('L', resized.size, 0)
-                draw = ImageDraw.Draw(mask)
-                draw.rounded_rectangle([(0, 0), resized.size], radius=radius, fill=255)
-                existing_alpha = resized.split()[3]
-                final_alpha = ImageChops.multiply(existing_alpha, mask)
-                resized.putalpha(final_alpha)
+            # Nearby scrub targets often decode to the same frame; the cell already shows it.
+            sig = (rot_val, fit, thumb_info['width'], thumb_info['height'], radius, frame_index)
+            if frame_index >= 0 and self._last_thumb_sig.get(index) == sig: return
+            self._last_thumb_sig[index] = sig
+            # Dragging back over a frame seen earlier in this drag reuses the finished cell.
+            resized = self._scrub_cells.get(sig) if frame_index >= 0 else None
+            if resized is not None:
+                self._scrub_cells.move_to_end(sig)
+            else:
+                resized = self._compose_scrub_cell(new_thumb_img, thumb_info['width'], thumb_info['height'], rot_val, fit, radius)
+                if frame_index >= 0:
+                    self._scrub_cells[sig] = resized
+                    if len(self._scrub_cells) > SCRUB_CELL_CACHE_SIZE: self._scrub_cells.popitem(last=False)
             canvas_handler.original_image.paste(resized, (thumb_info['x'], thumb_info['y']), mask=resized if radius > 0 else None)
-            canvas_handler._apply_zoom()
+            x, y = thumb_info['x'], thumb_info['y']
+            canvas_handler.apply_zoom_region((x, y, x + resized.width, y + resized.height))
         except Exception as e:
             logging.getLogger("preview").warning(f"Error updating preview thumbnail: {e}")
 
@@ -1550,12 +2197,10 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                 return
             final_input_list = self.batch_file_list
         else:
-            input_paths_str = self.input_paths_var.get()
-            final_input_list = [p.strip() for p in input_paths_str.split(';') if p.strip()]
+            final_input_list = list(self._current_input_paths())
             if not final_input_list:
                 messagebox.showerror("Input Error", "Please select video file(s).")
                 return
-            self._internal_input_paths = final_input_list
         
         settings = argparse.Namespace()
         settings.input_paths = final_input_list
@@ -1563,22 +2208,9 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         settings.output_dir = None
         
         try:
-            settings.layout_mode = self.layout_mode_var.get()
-            settings.extraction_mode = self.extraction_mode_var.get()
-            settings.shot_threshold = float(self.shot_threshold_var.get())
-            settings.frame_info_show = self.frame_info_show_var.get()
-            settings.detect_faces = self.detect_faces_var.get()
-            settings.rotate_thumbnails = int(self.rotate_thumbnails_var.get())
-            settings.output_quality = int(self.output_quality_var.get())
-            settings.hdr_tonemap = self.hdr_tonemap_var.get()
-            settings.hdr_algorithm = self.hdr_algorithm_var.get()
-            settings.fit_to_output_params = self.fit_to_output_params_var.get()
-            settings.output_width = int(self.output_width_var.get())
-            settings.output_height = int(self.output_height_var.get())
-            
-            # --- NEW SETTINGS ---
-            settings.recursive_scan = self.recursive_scan_var.get()
-            settings.overwrite_mode = self.overwrite_mode_var.get()
+            for field, var_name, convert in self._GENERATION_FIELDS:
+                value = getattr(self, var_name).get()
+                setattr(settings, field, convert(value) if convert else value)
 
             rows = int(self.num_rows_var.get())
             cols = int(self.num_columns_var.get())
@@ -1602,40 +2234,19 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                 settings.target_row_height = int(self.target_row_height_var.get() or 150)
                 settings.interval_seconds = None
 
-            settings.padding = int(self.padding_var.get())
-            settings.background_color = self.background_color_var.get()
-            settings.frame_format = self.frame_format_var.get()
             settings.save_metadata_json = False 
             settings.start_time = None
             settings.end_time = None
             settings.exclude_frames = None
             settings.exclude_shots = None
-            settings.output_naming_mode = self.output_naming_mode_var.get()
-            settings.output_filename_suffix = self.output_filename_suffix_var.get()
-            settings.output_filename = self.output_filename_var.get()
-            settings.output_frames_only = self.output_frames_only_var.get()
-            settings.individual_frames_output_dir = self.individual_frames_output_dir_var.get().strip()
             settings.temp_dir = None
             settings.haar_cascade_xml = None
-            settings.grid_margin = int(self.grid_margin_var.get())
-            settings.show_header = self.show_header_var.get()
-            settings.show_file_path = self.show_file_path_var.get()
-            settings.show_timecode = self.show_timecode_var.get()
-            settings.show_frame_num = self.show_frame_num_var.get()
-            settings.rounded_corners = int(self.rounded_corners_var.get())
             settings.max_output_filesize_kb = None
-            settings.use_gpu = self.use_gpu_var.get()
             settings.interval_frames = None
-            settings.output_image_width = int(self.output_width_var.get())
             settings.target_thumbnail_width = None
             settings.target_thumbnail_height = None
             settings.video_extensions = ".mp4,.avi,.mov,.mkv,.flv,.wmv"
-            settings.frame_info_timecode_or_frame = self.frame_info_timecode_or_frame_var.get()
-            settings.frame_info_font_color = self.frame_info_font_color_var.get()
-            settings.frame_info_bg_color = self.frame_info_bg_color_var.get()
-            settings.frame_info_position = self.frame_info_position_var.get()
-            settings.frame_info_size = int(self.frame_info_size_var.get())
-            settings.frame_info_margin = int(self.frame_info_margin_var.get())
+            settings.batch_workers = BATCH_WORKERS if active_tab == "Batch Queue" else 1
 
         except Exception as e:
              messagebox.showerror("Error", str(e))
@@ -1664,9 +2275,10 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         ).start()
 
     def run_generation_in_thread(self, settings, progress_cb):
-        thread_logger = logging.getLogger(f"gui_thread_{threading.get_ident()}")
+        thread_logger = logging.getLogger("gui_generation")
         thread_logger.setLevel(logging.INFO)
-        thread_logger.addHandler(QueueHandler(self.queue))
+        status_handler = StatusQueueHandler(self.queue)
+        thread_logger.addHandler(status_handler)
         try:
             successful_ops, failed_ops = DependencyManager.movieprint_maker(
                 settings, thread_logger, progress_cb, fast_preview=False
@@ -1676,6 +2288,7 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
             successful_ops = []
             failed_ops = [{"reason": str(e)}]
         finally:
+            thread_logger.removeHandler(status_handler)
             self.queue.put(("generation_done", {
                 "successful_ops": successful_ops,
                 "failed_ops": failed_ops,
@@ -1687,27 +2300,37 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.queue.put(("progress", (current, total, filename)))
 
     # --- HELPERS ---
+    def _set_input_paths(self, paths):
+        self._internal_input_paths = list(paths)
+        self._input_paths_text = "; ".join(self._internal_input_paths)
+        self.input_paths_var.set(self._input_paths_text)  # input_entry shows it through its textvariable
+
+    def _current_input_paths(self) -> List[str]:
+        """Single Source paths; the entry text is only re-split after the user edits it."""
+        text = self.input_paths_var.get()
+        if text != self._input_paths_text:
+            self._internal_input_paths = [p.strip() for p in text.split(';') if p.strip()]
+            self._input_paths_text = text
+        return self._internal_input_paths
+
     def browse_input_paths(self):
         filepaths = filedialog.askopenfilenames(title="Select Video File(s)")
-        if filepaths:
-            self._internal_input_paths = list(filepaths)
-            self.input_paths_var.set("; ".join(self._internal_input_paths))
-            self.input_entry.delete(0, tk.END)
-            self.input_entry.insert(0, self.input_paths_var.get())
+        if filepaths: self._set_input_paths(filepaths)
 
     def _add_batch_paths(self, paths):
-        added = 0
-        existing_keys = {os.path.normcase(os.path.abspath(path)) for path in self.batch_file_list}
+        new_paths = []
+        existing_keys = self._batch_keys
         for path in paths:
             normalised_path = os.path.abspath(path)
             key = os.path.normcase(normalised_path)
             if key in existing_keys:
                 continue
-            self.batch_file_list.append(normalised_path)
-            self.batch_listbox.insert(tk.END, normalised_path)
+            new_paths.append(normalised_path)
             existing_keys.add(key)
-            added += 1
-        if paths and not added:
+        if new_paths:
+            self.batch_file_list.extend(new_paths)
+            self.batch_listbox.insert(tk.END, *new_paths)
+        if paths and not new_paths:
             self.status_lbl.configure(text="Those items are already in the batch queue.")
 
     def browse_batch_files(self):
@@ -1727,21 +2350,21 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         if active_tab == "Batch Queue":
             self._add_batch_paths(paths)
         else:
-            self._internal_input_paths = list(paths)
-            self.input_paths_var.set("; ".join(paths))
-            self.input_entry.delete(0, tk.END)
-            self.input_entry.insert(0, self.input_paths_var.get())
+            self._set_input_paths(paths)
 
     def clear_batch_list(self):
         self.batch_file_list.clear()
+        self._batch_keys.clear()
         self.batch_listbox.delete(0, tk.END)
 
     def remove_batch_item(self):
         selection = self.batch_listbox.curselection()
         if not selection: return
-        for i in reversed(selection):
-            path = self.batch_listbox.get(i)
-            if path in self.batch_file_list: self.batch_file_list.remove(path)
+        # The listbox mirrors batch_file_list row for row, so remove by index.
+        selected = set(selection)
+        for i in selected: self._batch_keys.discard(os.path.normcase(self.batch_file_list[i]))
+        self.batch_file_list[:] = [p for i, p in enumerate(self.batch_file_list) if i not in selected]
+        for i in sorted(selected, reverse=True):
             self.batch_listbox.delete(i)
 
     def browse_output_dir(self):
@@ -1751,12 +2374,11 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
     def pick_bg_color(self):
         c = colorchooser.askcolor(color=self.background_color_var.get())
         if c[1]: self.background_color_var.set(c[1])
+    # Dragging only updates the value (and live math); the re-render waits for release.
     def _on_col_slider_change(self, value):
         self.num_columns_var.set(int(value))
-        self._update_live_math()
     def _on_row_slider_change(self, value):
         self.num_rows_var.set(int(value))
-        self._update_live_math()
     def _on_extraction_mode_change(self, value):
         if value == "interval" and self.layout_mode_var.get() == "timeline": self.layout_mode_var.set("grid")
         self.update_visibility_state()
@@ -1767,6 +2389,11 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
     def update_visibility_state(self, *args):
         layout = self.layout_mode_var.get()
         extraction = self.extraction_mode_var.get()
+        # Re-packing unchanged frames still makes Tk redo the sidebar geometry.
+        if (layout, extraction) == self._vis_state:
+            self._update_live_math()
+            return
+        self._vis_state = (layout, extraction)
         if layout == "grid":
             self.slider_frame.pack(fill="x", padx=10, pady=10, after=self.input_entry.master.master) 
             self.row_height_frame.pack_forget()
@@ -1778,19 +2405,21 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self._update_live_math()
 
     def _cleanup_garbage_dirs(self):
-        for d in self.temp_dirs_to_cleanup:
-            try: shutil.rmtree(d)
-            except OSError: pass
-
-    def _load_persistent_settings(self):
-        if not os.path.exists(SETTINGS_FILE): return
+        # Each preview dir holds dozens of frames; overlap the unlinks instead of waiting on each.
+        dirs = list(dict.fromkeys(self.temp_dirs_to_cleanup))
+        if not dirs: return
+        max_workers = max(1, min(4, len(dirs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda d: shutil.rmtree(d, ignore_errors=True), dirs))
+
+    def _load_persistent_settings(self, settings: Dict[str, Any]):
+        if not settings: return
         try:
             self._loading_persistent_settings = True
-            with open(SETTINGS_FILE, 'r') as f:
-                settings = json.load(f)
+            with self._modifying_settings():
                 self.input_paths_var.set(settings.get("input_paths", ""))
-                if self.input_paths_var.get():
-                     self._internal_input_paths = [p.strip() for p in self.input_paths_var.get().split(';') if p.strip()]
+                self._current_input_paths()
+                if "use_gpu" in settings: self._gpu_default_pending = False
                 for var_name, key in self.settings_map.items():
                     if key in settings and hasattr(self, var_name):
                         value = settings[key]
@@ -1799,12 +2428,7 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
                         getattr(self, var_name).set(value)
                 self.col_slider.set(int(self.num_columns_var.get() or 5))
                 self.row_slider.set(int(self.num_rows_var.get() or 5))
-                if hasattr(self, 'layout_mode_seg'): self.layout_mode_seg.set(self.layout_mode_var.get())
-                if hasattr(self, 'extraction_mode_seg'): self.extraction_mode_seg.set(self.extraction_mode_var.get())
-                if hasattr(self, 'ui_theme_seg'): self.ui_theme_seg.set(self.ui_theme_var.get())
-                if hasattr(self, 'rotate_seg'): self.rotate_seg.set(str(self.rotate_thumbnails_var.get()))
-                if hasattr(self, 'format_seg'): self.format_seg.set(self.frame_format_var.get())
-                if hasattr(self, 'overwrite_seg'): self.overwrite_seg.set(self.overwrite_mode_var.get())
+                self._sync_segmented_buttons()
                 self.update_visibility_state()
                 self._toggle_naming_inputs()
                 self._toggle_hdr_options()
@@ -1812,15 +2436,23 @@ class MoviePrintApp(ctk.CTk, TkinterDnD.DnDWrapper):
         finally:
             self._loading_persistent_settings = False
 
-    def _on_closing(self):
+    def _save_persistent_settings(self):
         settings = {}
-        for var_name, key in self.settings_map.items():
-            if hasattr(self, var_name): settings[key] = getattr(self, var_name).get()
-        try:
-            with open(SETTINGS_FILE, 'w') as f: json.dump(settings, f, indent=4)
-        except: pass
-        if self.preview_temp_dir and os.path.exists(self.preview_temp_dir): self.temp_dirs_to_cleanup.append(self.preview_temp_dir)
+        for get, key in self._bound_settings.values():
+            try: settings[key] = get()
+            except (tk.TclError, ValueError): pass
+        self._settings_writer.submit(settings)
+
+    def _on_closing(self):
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        self._flush_settings()
+        self._save_persistent_settings()
+        self._settings_writer.close()
+        self.temp_dirs_to_cleanup.extend(self._preview_dirs.values())
         self._cleanup_garbage_dirs()
+        stop_file_logging()
         self.destroy()
 
 if __name__ == "__main__":
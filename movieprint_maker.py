@@ -14,6 +14,7 @@ except ImportError as import_error:
     cv2 = None
     CV2_IMPORT_ERROR = import_error
 import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from version import __version__
 from PIL import Image
 
@@ -56,10 +57,35 @@ def parse_time_to_seconds(time_str):
         return float(h * 3600 + m * 60 + s)
     return None
 
+def _iter_video_files(root_dir, valid_extensions, recursive_scan):
+    """Yields video files under root_dir using os.scandir's cached DirEntry types.
+
+    Hidden entries are skipped, as glob would, and symlinked directories
+    are not descended into.
+    """
+    pending_dirs = [root_dir]
+    while pending_dirs:
+        try:
+            entries = os.scandir(pending_dirs.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive_scan:
+                            pending_dirs.append(entry.path)
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in valid_extensions:
+                        yield entry.path
+                except OSError:
+                    continue
+
 def discover_video_files(input_sources, valid_extensions_str, recursive_scan, logger):
     """Scans input paths (files or directories) for valid video files."""
     video_files_found = set()
-    valid_extensions = [ext.strip().lower() for ext in valid_extensions_str.split(',')]
+    valid_extensions = {ext.strip().lower() for ext in valid_extensions_str.split(',')}
     
     for source_path in input_sources:
         abs_source_path = os.path.abspath(source_path)
@@ -76,13 +102,7 @@ def discover_video_files(input_sources, valid_extensions_str, recursive_scan, lo
                 
         elif os.path.isdir(abs_source_path):
             logger.info(f"Scanning directory: {abs_source_path}{' (recursively)' if recursive_scan else ''}...")
-            scan_pattern = os.path.join(abs_source_path, "**", "*") if recursive_scan else os.path.join(abs_source_path, "*")
-            
-            for item_path in glob.glob(scan_pattern, recursive=recursive_scan):
-                if os.path.isfile(item_path):
-                    _, file_ext = os.path.splitext(item_path)
-                    if file_ext.lower() in valid_extensions: 
-                        video_files_found.add(item_path)
+            video_files_found.update(_iter_video_files(abs_source_path, valid_extensions, recursive_scan))
 
     return sorted(list(video_files_found))
 
@@ -531,7 +551,8 @@ def _save_metadata(metadata_list, layout_data, settings, start_sec, end_sec, pro
     
     json_path = os.path.splitext(movieprint_path)[0] + ".json"
     try:
-        with open(json_path, 'w') as f: json.dump(full_meta, f, indent=4)
+        data = json.dumps(full_meta, indent=4)
+        with open(json_path, 'w') as f: f.write(data)
         logger.info(f"  Metadata JSON saved to {json_path}")
     except Exception as e: logger.error(f"  Error saving metadata JSON: {e}")
 
@@ -675,17 +696,8 @@ def execute_movieprint_generation(settings, logger, progress_callback=None, fast
             ),
         })
 
-    for i, video_path in enumerate(video_files_to_process):
-        if _is_cancelled(settings):
-            logger.info("Cancellation requested. Stopping before the next video.")
-            setattr(settings, 'cancelled', True)
-            break
-
-        if progress_callback: progress_callback(i, total_videos, video_path)
-
-        if video_path in colliding_videos:
-            continue
-
+    def process_entry(video_path):
+        """Returns ('ok' | 'failed', record), or None when the video is skipped."""
         try:
             # Naming logic must be per-file so one bad custom name does not
             # leave the GUI worker stuck or obscure which source triggered it.
@@ -694,20 +706,80 @@ def execute_movieprint_generation(settings, logger, progress_callback=None, fast
 
             if overwrite_mode == 'skip' and os.path.exists(full_output_path):
                 logger.info(f"Skipping {video_path} (Output exists: {effective_output_name})")
-                continue
+                return None
 
             success, message_or_path = process_single_video(
                 video_path, settings, effective_output_name, logger, fast_preview=fast_preview
             )
-            if success: successful_ops.append({'video': video_path, 'output': message_or_path})
-            else: failed_ops.append({'video': video_path, 'reason': message_or_path})
+            if success: return 'ok', {'video': video_path, 'output': message_or_path}
+            return 'failed', {'video': video_path, 'reason': message_or_path}
         except Exception as e:
             logger.exception(f"CRITICAL ERROR processing {video_path}: {e}")
-            failed_ops.append({'video': video_path, 'reason': str(e)})
+            return 'failed', {'video': video_path, 'reason': str(e)}
+
+    def collect(result):
+        if result is None: return
+        kind, record = result
+        (successful_ops if kind == 'ok' else failed_ops).append(record)
+
+    workers = _batch_worker_count(settings, total_videos - len(colliding_videos))
+    if workers > 1:
+        _run_batch_concurrently(
+            [p for p in video_files_to_process if p not in colliding_videos],
+            process_entry, collect, workers, settings, logger, progress_callback, total_videos
+        )
+    else:
+        for i, video_path in enumerate(video_files_to_process):
+            if _is_cancelled(settings):
+                logger.info("Cancellation requested. Stopping before the next video.")
+                setattr(settings, 'cancelled', True)
+                break
+
+            if progress_callback: progress_callback(i, total_videos, video_path)
+
+            if video_path in colliding_videos:
+                continue
+
+            collect(process_entry(video_path))
 
     if progress_callback: progress_callback(total_videos, total_videos, "Batch completed")
     return successful_ops, failed_ops
 
+def _batch_worker_count(settings, pending_videos):
+    """How many videos to process at once; 1 keeps the classic sequential loop."""
+    try: requested = int(getattr(settings, 'batch_workers', 1) or 1)
+    except (TypeError, ValueError): requested = 1
+    # A fixed temp_dir names scratch folders by basename, which parallel jobs could share.
+    if getattr(settings, 'temp_dir', None): return 1
+    return max(1, min(requested, pending_videos))
+
+def _run_batch_concurrently(video_paths, process_entry, collect, workers, settings, logger, progress_callback, total_videos):
+    """
+    Runs process_entry for several videos at once. The heavy lifting (FFmpeg, OpenCV,
+    Pillow) happens outside the GIL, so threads overlap well without having to ship
+    the settings, logger and cancel flag to other processes. Progress counts videos
+    as they finish; results are collected in input order so the report matches the
+    sequential run.
+    """
+    def run(video_path):
+        if _is_cancelled(settings): return 'cancelled'
+        return process_entry(video_path)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="movieprint_batch") as pool:
+        futures = {pool.submit(run, video_path): i for i, video_path in enumerate(video_paths)}
+        results = [None] * len(video_paths)
+        # Colliding videos were already reported as failed; count them as done.
+        for done, future in enumerate(as_completed(futures), total_videos - len(video_paths) + 1):
+            i = futures[future]
+            results[i] = future.result()
+            if progress_callback: progress_callback(done, total_videos, video_paths[i])
+
+    if 'cancelled' in results:
+        logger.info("Cancellation requested. Remaining videos were not started.")
+        setattr(settings, 'cancelled', True)
+    for result in results:
+        if result != 'cancelled': collect(result)
+
 def main():
     parser = argparse.ArgumentParser(description="Create PyMoviePrints.")
     parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
@@ -728,6 +800,7 @@ def main():
     batch_grp = parser.add_argument_group("Batch Processing")
     batch_grp.add_argument("--video_extensions", type=str, default=".mp4,.avi,.mov,.mkv,.flv,.wmv")
     batch_grp.add_argument("--recursive_scan", action="store_true", help="Recursively scan directories.")
+    batch_grp.add_argument("--batch_workers", type=int, default=1, help="Videos to process at the same time.")
 
     # Time
     time_grp = parser.add_argument_group("Time Segment")
@@ -14,6 +14,7 @@ from PIL import Image
 
 import image_grid
 import movieprint_maker
+import video_processing
 
 
 class MoviePrintMakerTests(unittest.TestCase):
@@ -54,6 +55,24 @@ class MoviePrintMakerTests(unittest.TestCase):
             self.assertEqual(non_recursive, [top_video])
             self.assertEqual(recursive, sorted([top_video, nested_video]))
 
+    def test_discover_video_files_skips_hidden_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            visible = os.path.join(tmp, "clip.mp4")
+            hidden_file = os.path.join(tmp, ".clip.mp4")
+            hidden_dir = os.path.join(tmp, ".cache")
+            os.makedirs(hidden_dir, exist_ok=True)
+            hidden_nested = os.path.join(hidden_dir, "nested.mp4")
+
+            for path in (visible, hidden_file, hidden_nested):
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("x")
+
+            discovered = movieprint_maker.discover_video_files(
+                [tmp], ".mp4", recursive_scan=True, logger=self.logger
+            )
+
+            self.assertEqual(discovered, [visible])
+
     def test_discover_video_files_deduplicates_overlapping_inputs(self):
         with tempfile.TemporaryDirectory() as tmp:
             video = os.path.join(tmp, "clip.mp4")
@@ -269,6 +288,78 @@ class MoviePrintMakerTests(unittest.TestCase):
             self.assertTrue(settings.cancelled)
             process_mock.assert_not_called()
 
+    def test_execute_concurrent_batch_reports_in_input_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            videos = []
+            for name in ("a.mp4", "b.mp4", "c.mp4", "d.mp4"):
+                path = os.path.join(tmp, name)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("video")
+                videos.append(path)
+            settings = SimpleNamespace(
+                input_paths=[tmp], video_extensions=".mp4", recursive_scan=False,
+                frame_format="jpg", output_naming_mode="suffix", output_filename="",
+                output_filename_suffix="_movieprint", overwrite_mode="overwrite",
+                output_frames_only=False, output_dir=None, individual_frames_output_dir="",
+                batch_workers=3,
+            )
+            threads = set()
+            other_finished = threading.Event()
+
+            def fake_process(video_path, *_args, **_kwargs):
+                threads.add(threading.get_ident())
+                # The first video is the slow one: progress must not wait for it.
+                if video_path.endswith("a.mp4"): other_finished.wait(timeout=5)
+                if video_path.endswith("c.mp4"): return False, "broken"
+                return True, video_path + ".jpg"
+
+            progress = []
+
+            def on_progress(current, total, filename):
+                progress.append((current, total, filename))
+                if filename != videos[0]: other_finished.set()
+
+            with mock.patch.object(movieprint_maker, "_ensure_cv2_available", return_value=None), \
+                 mock.patch.object(movieprint_maker, "process_single_video", side_effect=fake_process):
+                successful, failed = movieprint_maker.execute_movieprint_generation(
+                    settings, self.logger, progress_callback=on_progress
+                )
+
+            self.assertEqual([entry["video"] for entry in successful], [videos[0], videos[1], videos[3]])
+            self.assertEqual(failed, [{"video": videos[2], "reason": "broken"}])
+            self.assertNotIn(threading.get_ident(), threads)
+            self.assertNotEqual(progress[0][2], videos[0])
+            self.assertEqual([entry[0] for entry in progress[:4]], [1, 2, 3, 4])
+            self.assertEqual(progress[-1][:2], (4, 4))
+            self.assertFalse(getattr(settings, "cancelled", False))
+
+    def test_execute_concurrent_batch_counts_colliding_videos_as_done(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            videos = []
+            for folder, name in (("shared", "part1.mp4"), ("shared", "part2.mp4"), ("x", "x.mp4"), ("y", "y.mp4")):
+                os.makedirs(os.path.join(tmp, folder), exist_ok=True)
+                path = os.path.join(tmp, folder, name)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("video")
+                videos.append(path)
+            settings = SimpleNamespace(
+                input_paths=videos, video_extensions=".mp4", recursive_scan=False,
+                frame_format="jpg", output_naming_mode="custom", output_filename="movieprint",
+                overwrite_mode="overwrite", output_frames_only=False, output_dir=None,
+                individual_frames_output_dir="", batch_workers=2,
+            )
+            progress = []
+
+            with mock.patch.object(movieprint_maker, "_ensure_cv2_available", return_value=None), \
+                 mock.patch.object(movieprint_maker, "process_single_video", return_value=(True, "out.jpg")):
+                successful, failed = movieprint_maker.execute_movieprint_generation(
+                    settings, self.logger, progress_callback=lambda *args: progress.append(args)
+                )
+
+            self.assertEqual(len(successful), 2)
+            self.assertEqual({entry["video"] for entry in failed}, set(videos[:2]))
+            self.assertEqual([entry[:2] for entry in progress[:2]], [(3, 4), (4, 4)])
+
     def test_execute_reports_invalid_custom_name_per_source(self):
         with tempfile.TemporaryDirectory() as tmp:
             video_path = os.path.join(tmp, "clip.mp4")
@@ -406,6 +497,98 @@ class MoviePrintMakerTests(unittest.TestCase):
             self.assertTrue(os.path.exists(output))
             self.assertGreater(layout_data[1]["width"], layout_data[0]["width"])
 
+    def test_compose_image_grid_rotates_and_rounds_cells(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            first = os.path.join(tmp, "first.jpg")
+            second = os.path.join(tmp, "second.jpg")
+            Image.new("RGB", (100, 50), "red").save(first)
+            Image.new("RGB", (100, 50), "blue").save(second)
+
+            grid, layout_data = image_grid.compose_image_grid(
+                image_source_data=[
+                    {"image_path": first, "timestamp_sec": 1.0},
+                    {"image_path": second, "timestamp_sec": 2.0},
+                ],
+                layout_mode="grid",
+                columns=2,
+                rows=1,
+                padding=4,
+                grid_margin=0,
+                rotation=90,
+                rounded_corners=8,
+                background_color_hex="#000000",
+                show_header=False,
+                frame_info_show=False,
+            )
+
+        self.assertEqual(grid.size, (104, 100))
+        self.assertEqual(
+            [(t["x"], t["y"], t["width"], t["height"]) for t in layout_data],
+            [(0, 0, 50, 100), (54, 0, 50, 100)],
+        )
+        # Rounded corners let the background through; cell centres keep the frame colour.
+        self.assertEqual(grid.getpixel((0, 0)), (0, 0, 0))
+        red, _, _ = grid.getpixel((25, 50))
+        self.assertGreater(red, 200)
+        _, _, blue = grid.getpixel((79, 50))
+        self.assertGreater(blue, 200)
+
+    def _extract_three_timestamps(self, tmp, run_ffmpeg):
+        video = os.path.join(tmp, "clip.mp4")
+        with open(video, "w", encoding="utf-8") as f:
+            f.write("video")
+        extractor = video_processing.VideoExtractor(video, self.logger)
+        env = {"PYMOVIEPRINT_FFMPEG_WORKERS": "1", "PYMOVIEPRINT_TIMESTAMP_GPU": "0"}
+        with mock.patch.dict(os.environ, env), \
+             mock.patch.object(video_processing.shutil, "which", return_value="ffmpeg"), \
+             mock.patch.object(video_processing.VideoExtractor, "properties", new=property(lambda self: (25.0, 10.0, 250))), \
+             mock.patch.object(video_processing.VideoUtils, "run_ffmpeg_command", side_effect=run_ffmpeg) as run_mock:
+            results = extractor.extract_timestamps_optimized([1.0, 2.5, 4.0], tmp)
+        paths = [os.path.join(tmp, f"thumb_{i:03d}_ts{ts:.2f}.jpg") for i, ts in enumerate([1.0, 2.5, 4.0])]
+        return video, paths, results, [c.args[0] for c in run_mock.call_args_list]
+
+    @staticmethod
+    def _write_outputs(cmd):
+        for arg in cmd:
+            if arg.endswith(".jpg"):
+                with open(arg, "wb") as f:
+                    f.write(b"jpg")
+
+    def test_extract_timestamps_batches_seeks_into_one_ffmpeg_process(self):
+        def run_ffmpeg(cmd, _logger):
+            self._write_outputs(cmd)
+            return True
+
+        with tempfile.TemporaryDirectory() as tmp:
+            video, paths, results, calls = self._extract_three_timestamps(tmp, run_ffmpeg)
+
+        expected = [video_processing.FFMPEG_BIN, "-y", "-hide_banner", "-loglevel", "error"]
+        for ts in ("1.0", "2.5", "4.0"):
+            expected += ["-ss", ts, "-i", video]
+        for n, path in enumerate(paths):
+            expected += ["-map", f"{n}:v:0", "-frames:v", "1", "-vf", "format=yuv420p", "-q:v", "2", path]
+        self.assertEqual(calls, [expected])
+        self.assertEqual([r["timestamp_sec"] for r in results], [1.0, 2.5, 4.0])
+        self.assertEqual([r["frame_path"] for r in results], paths)
+
+    def test_extract_timestamps_retries_failed_batch_per_frame(self):
+        def run_ffmpeg(cmd, _logger):
+            if cmd.count("-i") > 1: return False
+            self._write_outputs(cmd)
+            return True
+
+        with tempfile.TemporaryDirectory() as tmp:
+            video, paths, results, calls = self._extract_three_timestamps(tmp, run_ffmpeg)
+
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(calls[0].count("-i"), 3)
+        for cmd, ts, path in zip(calls[1:], ("1.0", "2.5", "4.0"), paths):
+            self.assertEqual(cmd.count("-i"), 1)
+            self.assertEqual(cmd[cmd.index("-ss") + 1], ts)
+            self.assertEqual(cmd[cmd.index("-vf") - 2:cmd.index("-vf")], ["-frames:v", "1"])
+            self.assertIn(path, cmd)
+        self.assertEqual([r["frame_path"] for r in results], paths)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -26,6 +26,8 @@ except ImportError:
 
 FFMPEG_BIN = 'ffmpeg'
 FFPROBE_BIN = 'ffprobe'
+PREVIEW_FRAME_WIDTH = 480  # Default width of fast_preview frames
+TIMESTAMP_BATCH_SIZE = 8  # Seeks served by one FFmpeg process in extract_timestamps_optimized
 
 
 def _ensure_cv2_available(logger: Optional[logging.Logger] = None):
@@ -41,6 +43,11 @@ def _ensure_cv2_available(logger: Optional[logging.Logger] = None):
         logger.error(message)
     raise RuntimeError(message)
 
+def _preview_scale_filter(width: int) -> str:
+    # Even dimensions keep yuv420p happy; -2 derives a matching even height.
+    width = max(2, int(width) // 2 * 2)
+    return f"scale={width}:-2"
+
 class VideoUtils:
     """Static utilities for system checks and FFmpeg capability probing."""
     
@@ -108,6 +115,39 @@ class VideoUtils:
             
         return VideoUtils._zscale_checked
 
+    @staticmethod
+    def probe_duration(video_path: str, logger: Optional[logging.Logger] = None) -> Optional[float]:
+        """Reads the duration in seconds with ffprobe (no decoder spin-up). None if unavailable."""
+        if not shutil.which(FFPROBE_BIN):
+            return None
+
+        cmd = [
+            FFPROBE_BIN, '-v', 'error', '-select_streams', 'v:0',
+            '-show_entries', 'stream=duration:format=duration',
+            '-of', 'json', video_path
+        ]
+        try:
+            res = subprocess.run(
+                cmd, 
+                capture_output=True, 
+                text=True, 
+                startupinfo=VideoUtils.get_startup_info(), 
+                timeout=10
+            )
+            data = json.loads(res.stdout or '{}')
+        except Exception as e:
+            if logger: logger.debug(f"ffprobe duration probe failed: {e}")
+            return None
+
+        # Stream duration is the most precise; some containers (MKV) only report it on the format.
+        for entry in data.get('streams', [])[:1] + [data.get('format', {})]:
+            try:
+                duration = float(entry.get('duration', 0))
+            except (TypeError, ValueError):
+                continue
+            if duration > 0: return duration
+        return None
+
     @staticmethod
     def run_ffmpeg_command(cmd: List[str], logger: logging.Logger) -> bool:
         try:
@@ -207,7 +247,8 @@ class VideoExtractor:
             self._is_hdr_confirmed = False
             return False
 
-    def extract_single_frame(self, timestamp_sec: float) -> Optional[Any]:
+    def extract_single_frame(self, timestamp_sec: float, out: Optional[Any] = None) -> Optional[Any]:
+        """Reads the frame at timestamp_sec, decoding into `out` when its shape matches."""
         cap = self._cap
         local_open = False
         if not cap or not cap.isOpened():
@@ -216,11 +257,17 @@ class VideoExtractor:
         try:
             if not cap.isOpened(): return None
             cap.set(cv2.CAP_PROP_POS_MSEC, timestamp_sec * 1000)
-            ret, frame = cap.read()
+            ret, frame = cap.read(out) if out is not None else cap.read()
             return frame if ret else None
         finally:
             if local_open: cap.release()
 
+    def decoded_frame_index(self) -> int:
+        """Index of the frame the open capture last decoded, or -1 when no capture is held."""
+        cap = self._cap
+        if not cap or not cap.isOpened(): return -1
+        return int(cap.get(cv2.CAP_PROP_POS_FRAMES)) - 1
+
     def _build_hdr_filter_chain(self, hdr_algorithm: str) -> str:
         has_zscale = VideoUtils.check_ffmpeg_zscale(self.logger)
         algo = hdr_algorithm.lower() if hdr_algorithm else 'hable'
@@ -245,7 +292,8 @@ class VideoExtractor:
             )
 
     def extract_timestamps_optimized(self, timestamps: List[float], output_folder: str, ext: str = "jpg", 
-                                      fast_preview: bool = False, hdr_tonemap: bool = False, hdr_algorithm: str = 'hable') -> List[Dict[str, Any]]:
+                                      fast_preview: bool = False, hdr_tonemap: bool = False, hdr_algorithm: str = 'hable',
+                                      preview_width: int = PREVIEW_FRAME_WIDTH) -> List[Dict[str, Any]]:
         """
         Extracts frames using FFmpeg Seeking (-ss).
         Handles BOTH SDR and HDR content.
@@ -281,27 +329,39 @@ class VideoExtractor:
 
         hdr_filters = self._build_hdr_filter_chain(hdr_algorithm) if hdr_tonemap else ""
         
+        # Construct Filter Chain
+        filters = []
+        if hdr_tonemap:
+            filters.append(hdr_filters)
+
+        if fast_preview:
+            filters.append(_preview_scale_filter(preview_width))
+
+        # Ensure standard pixel format for output if not handled by tone mapper
+        if not hdr_tonemap:
+            filters.append("format=yuv420p")
+
+        vf_filter = ",".join(filters)
+        q_scale = '5' if fast_preview else '2'
+
+        def frame_path(i, ts):
+            return os.path.join(output_folder, f"thumb_{i:03d}_ts{ts:.2f}.{ext}")
+
+        def frame_meta(ts, final_path):
+            if os.path.exists(final_path):
+                return {
+                    'frame_path': final_path,
+                    'frame_number': int(ts * fps),
+                    'timestamp_sec': ts,
+                    'video_filename': self.video_filename
+                }
+            return None
+
         def extract_one(i, ts):
             if not fast_preview:
                 self.logger.info(f"  ... Extracting frame {i+1}/{total_frames} at {ts:.2f}s ...")
 
-            # Construct Filter Chain
-            filters = []
-            if hdr_tonemap:
-                filters.append(hdr_filters)
-
-            if fast_preview:
-                filters.append("scale=480:-1")
-
-            # Ensure standard pixel format for output if not handled by tone mapper
-            if not hdr_tonemap:
-                filters.append("format=yuv420p")
-
-            vf_filter = ",".join(filters)
-            q_scale = '5' if fast_preview else '2'
-
-            final_name = f"thumb_{i:03d}_ts{ts:.2f}.{ext}"
-            final_path = os.path.join(output_folder, final_name)
+            final_path = frame_path(i, ts)
             
             cmd = [FFMPEG_BIN]
             if use_gpu:
@@ -319,17 +379,33 @@ class VideoExtractor:
                 '-y', '-hide_banner', '-loglevel', 'error'
             ])
 
-            success = VideoUtils.run_ffmpeg_command(cmd, self.logger)
-
-            if success and os.path.exists(final_path):
-                return {
-                    'frame_path': final_path,
-                    'frame_number': int(ts * fps),
-                    'timestamp_sec': ts,
-                    'video_filename': self.video_filename
-                }
+            if VideoUtils.run_ffmpeg_command(cmd, self.logger):
+                return frame_meta(ts, final_path)
             return None
 
+        def extract_batch(batch):
+            """One FFmpeg process for several timestamps: each gets its own
+            input-seeked copy of the source and a one-frame output."""
+            if len(batch) == 1:
+                return [extract_one(*batch[0])]
+
+            cmd = [FFMPEG_BIN, '-y', '-hide_banner', '-loglevel', 'error']
+            for _i, ts in batch:
+                cmd.extend(['-ss', str(ts), '-i', self.video_path])
+
+            paths = []
+            for n, (i, ts) in enumerate(batch):
+                if not fast_preview:
+                    self.logger.info(f"  ... Extracting frame {i+1}/{total_frames} at {ts:.2f}s ...")
+                final_path = frame_path(i, ts)
+                paths.append(final_path)
+                cmd.extend(['-map', f'{n}:v:0', '-frames:v', '1', '-vf', vf_filter, '-q:v', q_scale, final_path])
+
+            if not VideoUtils.run_ffmpeg_command(cmd, self.logger):
+                # Retry one process per frame so a single bad seek can't sink the batch
+                return [extract_one(i, ts) for i, ts in batch]
+            return [frame_meta(ts, p) for (_i, ts), p in zip(batch, paths)]
+
         max_workers = 1
         if total_frames > 1 and not use_gpu and not hdr_tonemap:
             env_workers = os.getenv("PYMOVIEPRINT_FFMPEG_WORKERS")
@@ -341,19 +417,23 @@ class VideoExtractor:
             else:
                 max_workers = min(4, total_frames, os.cpu_count() or 1)
 
+        # GPU and tone-mapped extraction keep one frame per process; plain CPU
+        # extraction shares each process start-up across a batch of seeks.
+        batch_size = 1
+        if not use_gpu and not hdr_tonemap:
+            batch_size = max(1, min(TIMESTAMP_BATCH_SIZE, math.ceil(total_frames / max_workers)))
+        indexed = list(enumerate(timestamps))
+        batches = [indexed[k:k + batch_size] for k in range(0, total_frames, batch_size)]
+
         if max_workers == 1:
-            for i, ts in enumerate(timestamps):
-                result = extract_one(i, ts)
-                if result:
-                    results.append(result)
+            for batch in batches:
+                results.extend(r for r in extract_batch(batch) if r)
         else:
             self.logger.info(f"  Extracting frames with {max_workers} parallel FFmpeg workers.")
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(extract_one, i, ts) for i, ts in enumerate(timestamps)]
+                futures = [executor.submit(extract_batch, batch) for batch in batches]
                 for future in as_completed(futures):
-                    result = future.result()
-                    if result:
-                        results.append(result)
+                    results.extend(r for r in future.result() if r)
 
         results.sort(key=lambda x: x['timestamp_sec'])
         return results
@@ -429,7 +509,8 @@ class VideoExtractor:
                           interval_sec: Optional[float] = None, interval_frames: Optional[int] = None,
                           ext: str = "jpg", use_gpu: bool = False, start_time: float = 0.0, end_time: Optional[float] = None,
                           fast_preview: bool = False,
-                          hdr_tonemap: bool = False, hdr_algorithm: str = 'hable') -> List[Dict[str, Any]]:
+                          hdr_tonemap: bool = False, hdr_algorithm: str = 'hable',
+                          preview_width: int = PREVIEW_FRAME_WIDTH) -> List[Dict[str, Any]]:
         # This function handles the 'Interval' mode where we output many frames at once.
         # We leave this mostly as-is but ensuring GPU logic is safe.
         if not shutil.which(FFMPEG_BIN):
@@ -450,7 +531,7 @@ class VideoExtractor:
             filters.append(self._build_hdr_filter_chain(hdr_algorithm))
         
         if fast_preview: 
-            filters.append("scale=480:-1")
+            filters.append(_preview_scale_filter(preview_width))
         
         if not hdr_tonemap:
              filters.append("format=yuv420p")
@@ -459,6 +540,11 @@ class VideoExtractor:
         q_scale = '5' if fast_preview else '2'
 
         output_pattern = os.path.join(output_folder, f"ffmpeg_out_%05d.{ext}")
+        # A reused output folder may still hold a previous run's numbered files; they
+        # would be globbed into this run's results below.
+        for stale in glob.glob(os.path.join(output_folder, f"ffmpeg_out_*.{ext}")):
+            try: os.remove(stale)
+            except OSError: pass
         base_cmd = [FFMPEG_BIN]
         
         if hdr_tonemap: use_gpu = False
@@ -487,7 +573,7 @@ class VideoExtractor:
             est_frame = int(est_time * fps)
             final_path = os.path.join(output_folder, f"frame_{i:05d}_absFN{est_frame}.{ext}")
             try:
-                os.rename(file_path, final_path)
+                os.replace(file_path, final_path)  # os.rename refuses existing targets on Windows
                 results.append({
                     'frame_path': final_path, 
                     'frame_number': est_frame, 
@@ -500,7 +586,7 @@ class VideoExtractor:
         return results
 
 # Legacy Wrappers
-def extract_frames_from_timestamps(video_path, timestamps, output_folder, logger, output_format="jpg", fast_preview=False, hdr_tonemap=False, hdr_algorithm='hable'):
+def extract_frames_from_timestamps(video_path, timestamps, output_folder, logger, output_format="jpg", fast_preview=False, hdr_tonemap=False, hdr_algorithm='hable', preview_width=PREVIEW_FRAME_WIDTH):
     _ensure_cv2_available(logger)
     """
     Unified entry point for Grid/Manual timestamp extraction.
@@ -515,7 +601,7 @@ def extract_frames_from_timestamps(video_path, timestamps, output_folder, logger
         # We now use the optimized FFmpeg extractor for EVERYTHING.
         # It handles SDR (by not adding tone map filters) and HDR (by adding them) efficiently.
         return True, ex.extract_timestamps_optimized(
-            timestamps, output_folder, output_format, fast_preview, hdr_tonemap, hdr_algorithm
+            timestamps, output_folder, output_format, fast_preview, hdr_tonemap, hdr_algorithm, preview_width
         )
 
 def extract_shot_boundary_frames(video_path, output_folder, logger, detector_threshold=27.0, output_format="jpg", start_time_sec=0.0, end_time_sec=None, hdr_tonemap=False, hdr_algorithm='hable'):
@@ -531,11 +617,11 @@ def extract_shot_boundary_frames(video_path, output_folder, logger, detector_thr
             hdr_algorithm=hdr_algorithm
         )
 
-def extract_frames(video_path, output_folder, logger, interval_seconds=None, interval_frames=None, output_format="jpg", start_time_sec=0.0, end_time_sec=None, use_gpu=False, fast_preview=False, hdr_tonemap=False, hdr_algorithm='hable'):
+def extract_frames(video_path, output_folder, logger, interval_seconds=None, interval_frames=None, output_format="jpg", start_time_sec=0.0, end_time_sec=None, use_gpu=False, fast_preview=False, hdr_tonemap=False, hdr_algorithm='hable', preview_width=PREVIEW_FRAME_WIDTH):
     _ensure_cv2_available(logger)
     with VideoExtractor(video_path, logger) as ex:
         if not hdr_tonemap and ex.detect_hdr():
              logger.info("  [Auto-Detect] HDR content identified. Enabling Tone Mapping.")
              hdr_tonemap = True
-        meta = ex.extract_via_ffmpeg(output_folder, interval_seconds, interval_frames, output_format, use_gpu, start_time_sec, end_time_sec, fast_preview, hdr_tonemap, hdr_algorithm)
+        meta = ex.extract_via_ffmpeg(output_folder, interval_seconds, interval_frames, output_format, use_gpu, start_time_sec, end_time_sec, fast_preview, hdr_tonemap, hdr_algorithm, preview_width)
     return True, meta